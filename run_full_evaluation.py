@@ -9,41 +9,57 @@ project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
 import asyncio
-import yaml
 from dotenv import load_dotenv
-from src.autogen_orchestrator import AutoGenOrchestrator
-from src.evaluation.evaluator import SystemEvaluator
+
+from src.config import load_config
+
+
+def _flush(lines):
+    """Write buffered progress lines in one syscall instead of per-print."""
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+    lines.clear()
+
 
 async def main():
     # Load environment
     load_dotenv()
 
-    # Load config
-    with open("config.yaml", 'r') as f:
-        config = yaml.safe_load(f)
+    # Load config (parsed + validated once, cached for later callers)
+    config = load_config("config.yaml").raw
+
+    # Import after env/config are validated: pulling in autogen + httpx costs
+    # ~1-2s of startup, which early-exit error paths shouldn't pay
+    from src.autogen_orchestrator import AutoGenOrchestrator
+    from src.evaluation.evaluator import SystemEvaluator
 
-    print("=" * 70)
-    print("RUNNING FULL EVALUATION WITH ORCHESTRATOR")
-    print("=" * 70)
+    # Buffer progress output and flush once per section so piped/CI logs
+    # don't pay a write syscall per line
+    lines = []
+    lines.append("=" * 70)
+    lines.append("RUNNING FULL EVALUATION WITH ORCHESTRATOR")
+    lines.append("=" * 70)
 
     # Initialize orchestrator
-    print("\n1. Initializing AutoGen orchestrator...")
+    lines.append("\n1. Initializing AutoGen orchestrator...")
     try:
         orchestrator = AutoGenOrchestrator(config)
-        print("   [OK] Orchestrator initialized")
+        lines.append("   [OK] Orchestrator initialized")
     except Exception as e:
-        print(f"   [ERROR] Failed to initialize orchestrator: {e}")
+        lines.append(f"   [ERROR] Failed to initialize orchestrator: {e}")
+        _flush(lines)
         return
 
     # Initialize evaluator with orchestrator
-    print("\n2. Initializing evaluator...")
+    lines.append("\n2. Initializing evaluator...")
     evaluator = SystemEvaluator(config, orchestrator=orchestrator)
-    print("   [OK] Evaluator initialized")
+    lines.append("   [OK] Evaluator initialized")
 
     # Run evaluation on all 10 queries
-    print("\n3. Running evaluation on all test queries...")
-    print("   This will take several minutes...")
-    print("   Progress will be shown for each query.\n")
+    lines.append("\n3. Running evaluation on all test queries...")
+    lines.append("   This will take several minutes...")
+    lines.append("   Progress will be shown for each query.\n")
+    _flush(lines)
 
     try:
         report = await evaluator.evaluate_system(
@@ -52,56 +68,66 @@ async def main():
         )
 
         # Display summary
-        print("\n" + "=" * 70)
-        print("EVALUATION COMPLETE")
-        print("=" * 70)
+        lines.append("\n" + "=" * 70)
+        lines.append("EVALUATION COMPLETE")
+        lines.append("=" * 70)
 
         summary = report.get("summary", {})
-        print(f"\nTotal Queries: {summary.get('total_queries', 0)}")
-        print(f"Successful: {summary.get('successful', 0)}")
-        print(f"Failed: {summary.get('failed', 0)}")
-        print(f"Success Rate: {summary.get('success_rate', 0):.1%}")
+        lines.append(f"\nTotal Queries: {summary.get('total_queries', 0)}")
+        lines.append(f"Successful: {summary.get('successful', 0)}")
+        lines.append(f"Failed: {summary.get('failed', 0)}")
+        lines.append(f"Success Rate: {summary.get('success_rate', 0):.1%}")
 
         scores = report.get("scores", {})
         if "combined_average" in scores:
-            print(f"\nCombined Score: {scores['combined_average']:.3f}")
-            print(f"Academic Perspective: {scores.get('by_perspective', {}).get('academic', 0):.3f}")
-            print(f"Practical Perspective: {scores.get('by_perspective', {}).get('practical', 0):.3f}")
+            lines.append(f"\nCombined Score: {scores['combined_average']:.3f}")
+            lines.append(f"Academic Perspective: {scores.get('by_perspective', {}).get('academic', 0):.3f}")
+            lines.append(f"Practical Perspective: {scores.get('by_perspective', {}).get('practical', 0):.3f}")
 
         # Show interpretation
         interp = report.get("interpretation", {})
         if interp:
-            print(f"\nInterpretation:")
-            print(f"  {interp.get('summary', 'N/A')}")
+            lines.append(f"\nInterpretation:")
+            lines.append(f"  {interp.get('summary', 'N/A')}")
 
             if interp.get('strengths'):
-                print(f"\n  Strengths:")
+                lines.append(f"\n  Strengths:")
                 for s in interp['strengths']:
-                    print(f"    [+] {s}")
+                    lines.append(f"    [+] {s}")
 
             if interp.get('weaknesses'):
-                print(f"\n  Weaknesses:")
+                lines.append(f"\n  Weaknesses:")
                 for w in interp['weaknesses']:
-                    print(f"    [-] {w}")
+                    lines.append(f"    [-] {w}")
 
         # Show error analysis
         errors = report.get("error_analysis", {})
         if errors and errors.get('total_errors', 0) > 0:
-            print(f"\nError Analysis:")
-            print(f"  Total Errors: {errors['total_errors']}")
+            lines.append(f"\nError Analysis:")
+            lines.append(f"  Total Errors: {errors['total_errors']}")
             if errors.get('patterns'):
-                print(f"  Patterns:")
+                lines.append(f"  Patterns:")
                 for p in errors['patterns']:
-                    print(f"    [!] {p}")
+                    lines.append(f"    [!] {p}")
 
-        print("\n" + "=" * 70)
-        print("Results saved to outputs/ directory")
-        print("=" * 70)
+        lines.append("\n" + "=" * 70)
+        lines.append("Results saved to outputs/ directory")
+        lines.append("=" * 70)
+        _flush(lines)
 
     except Exception as e:
+        if lines:
+            _flush(lines)
         print(f"\n[ERROR] Error during evaluation: {e}")
         import traceback
         traceback.print_exc()
 
 if __name__ == "__main__":
+    # The run is entirely I/O-bound (LLM + search APIs), so use the
+    # libuv-backed event loop when available for faster socket handling
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass  # uvloop is optional (not available on Windows)
     asyncio.run(main())
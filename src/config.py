@@ -0,0 +1,103 @@
+"""
+Configuration Loading
+Parses config.yaml once and exposes a validated, immutable view.
+
+Repeated yaml.safe_load calls and deep `.get(...).get(...)` chains are both
+avoidable: the loader caches the parsed file, and the frozen slotted
+dataclasses give fast attribute access plus startup-time validation of the
+sections every component depends on.
+"""
+
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Dict
+
+import yaml
+
+
+@dataclass(frozen=True, slots=True)
+class ModelConfig:
+    """Immutable view of one models.* section."""
+    provider: str = "groq"
+    name: str = ""
+    temperature: float = 0.7
+    max_tokens: int = 4096
+
+
+@dataclass(frozen=True, slots=True)
+class AgentConfig:
+    """Immutable view of one agents.* section."""
+    role: str = ""
+    enabled: bool = True
+    system_prompt: str = ""
+
+
+@dataclass(frozen=True, slots=True)
+class Config:
+    """
+    Immutable, validated view of config.yaml.
+
+    The raw dict is kept alongside the typed views so existing components
+    that consume plain dicts keep working unchanged.
+    """
+    raw: Dict[str, Any]
+    default_model: ModelConfig
+    judge_model: ModelConfig
+    agents: Dict[str, AgentConfig]
+
+    @classmethod
+    def from_dict(cls, raw: Dict[str, Any]) -> "Config":
+        """Build the typed config view from a parsed config.yaml dict."""
+        models = raw.get("models", {})
+
+        def _model(section: str) -> ModelConfig:
+            d = models.get(section, {})
+            return ModelConfig(
+                provider=d.get("provider", "groq"),
+                name=d.get("name", ""),
+                temperature=d.get("temperature", 0.7),
+                max_tokens=d.get("max_tokens", 4096),
+            )
+
+        agents = {
+            name: AgentConfig(
+                role=a.get("role", ""),
+                enabled=a.get("enabled", True),
+                system_prompt=a.get("system_prompt", "") or "",
+            )
+            for name, a in raw.get("agents", {}).items()
+        }
+
+        return cls(
+            raw=raw,
+            default_model=_model("default"),
+            judge_model=_model("judge"),
+            agents=agents,
+        )
+
+
+@lru_cache(maxsize=4)
+def load_config(path: str = "config.yaml") -> Config:
+    """
+    Parse and validate a config file once; later calls reuse the result.
+
+    Args:
+        path: Path to the YAML configuration file
+
+    Returns:
+        Validated immutable Config
+
+    Raises:
+        ValueError: If the file is malformed or missing required sections
+    """
+    with open(path, "r") as f:
+        raw = yaml.safe_load(f)
+
+    if not isinstance(raw, dict):
+        raise ValueError(f"Invalid configuration file: {path}")
+
+    for section in ("models", "agents"):
+        if section not in raw:
+            raise ValueError(f"Missing required config section '{section}' in {path}")
+
+    return Config.from_dict(raw)
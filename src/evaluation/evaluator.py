@@ -14,14 +14,52 @@ Example usage:
 """
 
 from typing import Dict, Any, List, Optional
+import functools
+import hashlib
+import io
 import json
 import logging
+import pickle
+import re
+from collections import Counter, defaultdict
 from pathlib import Path
 from datetime import datetime
 import asyncio
 
+# orjson serializes large reports ~5-10x faster than stdlib json;
+# fall back to json if it isn't installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# NumPy computes the aggregation statistics (mean/median/std over score
+# arrays) in vectorized C loops; fall back to pure Python if unavailable
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 from .judge import LLMJudge
 
+# Shared read-only fallback for missing nested dicts in aggregation loops;
+# avoids allocating a fresh empty dict per .get miss
+_EMPTY: Dict[str, Any] = {}
+
+
+_WORD_RE = re.compile(r"\w+")
+
+
+@functools.lru_cache(maxsize=128)
+def _topic_pattern(topics_lower: tuple) -> "re.Pattern":
+    """
+    Compile a fused alternation over a topic set (longest-first so nested
+    topics prefer the longer match). Cached per topic set: test suites reuse
+    the same expected_topics across runs, so each set compiles once.
+    """
+    ordered = sorted(topics_lower, key=len, reverse=True)
+    return re.compile("|".join(re.escape(t) for t in ordered))
+
 
 class SystemEvaluator:
     """
@@ -48,17 +86,43 @@ class SystemEvaluator:
         self.enabled = eval_config.get("enabled", True)
         self.max_test_queries = eval_config.get("num_test_queries", None)
         self.use_multi_perspective = eval_config.get("use_multi_perspective", True)
+        self.cache_reports = eval_config.get("cache_reports", False)
+        self.concurrency = eval_config.get("concurrency", 8)
+        self.query_timeout_s = eval_config.get("query_timeout_s", 120)
+
+        # Optional on-disk judge verdict cache: reruns over identical
+        # (query, response, sources, ground truth, perspective, criteria)
+        # inputs skip the judge LLM round-trip entirely
+        self.use_judge_cache = eval_config.get("use_judge_cache", False)
+        self._judge_cache_dir = Path(eval_config.get("judge_cache_dir", "outputs/.judge_cache"))
+        if self.use_judge_cache:
+            self._judge_cache_dir.mkdir(parents=True, exist_ok=True)
 
         # Initialize judge
         self.judge = LLMJudge(config)
 
+        # Criteria are fixed for the evaluator's lifetime; materialize the
+        # names once instead of rebuilding the list for every report
+        self._criterion_names = tuple(c["name"] for c in self.judge.criteria)
+        self._criterion_names_set = frozenset(self._criterion_names)
+
         # Evaluation results
         self.results: List[Dict[str, Any]] = []
 
         # Error tracking for analysis
         self.errors: List[Dict[str, Any]] = []
 
-        self.logger.info(f"SystemEvaluator initialized (enabled={self.enabled}, multi_perspective={self.use_multi_perspective})")
+        # Path of the per-run detailed results sidecar (set by evaluate_system)
+        self._detailed_path: Optional[Path] = None
+
+        # The orchestrator wraps one shared RoundRobinGroupChat, and AutoGen
+        # teams raise "The team is already running" on re-entry - so
+        # orchestrator runs must be serialized. Concurrency still pays off
+        # because the judge stage (the other LLM round-trips per query)
+        # overlaps freely across in-flight queries.
+        self._orchestrator_lock = asyncio.Lock()
+
+        self.logger.info("SystemEvaluator initialized (enabled=%s, multi_perspective=%s)", self.enabled, self.use_multi_perspective)
 
     async def evaluate_system(
         self,
@@ -79,6 +143,14 @@ class SystemEvaluator:
             self.logger.warning("Evaluation is disabled in config.yaml")
             return {"error": "Evaluation is disabled in configuration"}
 
+        # Re-running the evaluation during iteration re-executes every LLM
+        # call; if inputs are unchanged, reuse the cached report instead
+        if self.cache_reports:
+            cached_report = self._load_cached_report(test_queries_path)
+            if cached_report is not None:
+                self.logger.info("Inputs unchanged - returning cached evaluation report")
+                return cached_report
+
         self.logger.info("Starting system evaluation")
         self.results = []
         self.errors = []
@@ -88,28 +160,57 @@ class SystemEvaluator:
         if not test_queries:
             return {"error": "No test queries found"}
 
-        self.logger.info(f"Loaded {len(test_queries)} test queries")
+        self.logger.info("Loaded %d test queries", len(test_queries))
 
-        # Evaluate each query
-        for i, test_case in enumerate(test_queries, 1):
-            self.logger.info(f"Evaluating query {i}/{len(test_queries)}: {test_case.get('query', '')[:50]}...")
+        # Evaluate queries concurrently. Orchestrator runs serialize on
+        # _orchestrator_lock (the shared team cannot run twice at once), but
+        # one query's judge calls overlap the next query's orchestrator run,
+        # so wallclock still drops well below the sum of latencies. The
+        # semaphore caps in-flight queries to respect provider rate limits.
+        semaphore = asyncio.Semaphore(self.concurrency)
+        total = len(test_queries)
 
-            try:
-                result = await self._evaluate_query(test_case, use_multi_perspective)
-                self.results.append(result)
-            except Exception as e:
-                self.logger.error(f"Error evaluating query {i}: {e}")
-                error_entry = {
-                    "query_id": test_case.get("id", i),
-                    "query": test_case.get("query", ""),
-                    "error": str(e),
-                    "error_type": type(e).__name__
-                }
-                self.errors.append(error_entry)
-                self.results.append({
-                    "query": test_case.get("query", ""),
-                    "error": str(e)
-                })
+        # Per-result details stream to a JSONL sidecar as they complete;
+        # the report then carries a pointer instead of embedding the full
+        # list, keeping the summary JSON small and human-openable
+        output_dir = Path("outputs")
+        output_dir.mkdir(exist_ok=True)
+        run_stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        self._detailed_path = output_dir / f"detailed_{run_stamp}.jsonl"
+        detailed_fp = open(self._detailed_path, "wb")
+
+        async def _run_one(i: int, test_case: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+            async with semaphore:
+                self.logger.info("Evaluating query %d/%d: %.50s...", i, total, test_case.get("query", ""))
+                try:
+                    record = result = await self._evaluate_query(test_case, use_multi_perspective)
+                except Exception as e:
+                    self.logger.error("Error evaluating query %d: %s", i, e)
+                    # A failure lives only in self.errors; the results slot
+                    # stays None so the report never re-scans for "error" keys
+                    record = {
+                        "index": i,
+                        "query_id": test_case.get("id", i),
+                        "query": test_case.get("query", ""),
+                        "error": str(e),
+                        "error_type": type(e).__name__
+                    }
+                    self.errors.append(record)
+                    result = None
+                if orjson is not None:
+                    line = orjson.dumps(record) + b"\n"
+                else:
+                    line = (json.dumps(record, default=str) + "\n").encode()
+                detailed_fp.write(line)
+                return result
+
+        try:
+            # gather preserves input order, so results stay aligned with queries
+            self.results = list(await asyncio.gather(
+                *(_run_one(i, tc) for i, tc in enumerate(test_queries, 1))
+            ))
+        finally:
+            detailed_fp.close()
 
         # Generate comprehensive report
         report = self._generate_report(use_multi_perspective)
@@ -117,11 +218,49 @@ class SystemEvaluator:
         # Add error analysis
         report["error_analysis"] = self._analyze_errors()
 
-        # Save results
-        self._save_results(report)
+        # Save results (off-loop so disk I/O doesn't stall callers that
+        # embed evaluate_system in a larger async application)
+        await self._save_results(report)
+
+        if self.cache_reports:
+            self._store_cached_report(test_queries_path, report)
 
         return report
 
+    def _report_cache_key(self, test_queries_path: str) -> str:
+        """Hash the evaluation inputs (config + test queries) into a cache key."""
+        h = hashlib.sha256()
+        for path in ("config.yaml", test_queries_path):
+            try:
+                h.update(Path(path).read_bytes())
+            except OSError:
+                h.update(str(path).encode("utf-8"))
+        return h.hexdigest()
+
+    def _load_cached_report(self, test_queries_path: str) -> Optional[Dict[str, Any]]:
+        """Load a previously cached report for these inputs, if one exists."""
+        cache_file = Path("outputs/.cache") / f"{self._report_cache_key(test_queries_path)}.pkl"
+        if not cache_file.exists():
+            return None
+        try:
+            with open(cache_file, "rb") as f:
+                return pickle.load(f)
+        except Exception as e:
+            self.logger.warning("Failed to load cached report: %s", e)
+            return None
+
+    def _store_cached_report(self, test_queries_path: str, report: Dict[str, Any]):
+        """Persist the report keyed on the evaluation inputs (best-effort)."""
+        cache_dir = Path("outputs/.cache")
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            cache_file = cache_dir / f"{self._report_cache_key(test_queries_path)}.pkl"
+            with open(cache_file, "wb") as f:
+                pickle.dump(report, f)
+            self.logger.info("Report cached to %s", cache_file)
+        except Exception as e:
+            self.logger.warning("Failed to cache report: %s", e)
+
     async def _evaluate_query(
         self,
         test_case: Dict[str, Any],
@@ -145,9 +284,25 @@ class SystemEvaluator:
         # Run through orchestrator if available
         if self.orchestrator:
             try:
-                response_data = self.orchestrator.process_query(query)
+                # process_query is synchronous; run it on a worker thread so
+                # the event loop stays free for the overlapping judge calls.
+                # The lock serializes team runs (see __init__); the timeout
+                # keeps a stuck orchestrator from holding it for the rest of
+                # the run.
+                async with self._orchestrator_lock:
+                    response_data = await asyncio.wait_for(
+                        asyncio.to_thread(self.orchestrator.process_query, query),
+                        timeout=self.query_timeout_s
+                    )
+            except asyncio.TimeoutError:
+                self.logger.error("Orchestrator timed out after %ss", self.query_timeout_s)
+                response_data = {
+                    "query": query,
+                    "response": f"Error: orchestrator timed out after {self.query_timeout_s}s",
+                    "metadata": {"error": "timeout"}
+                }
             except Exception as e:
-                self.logger.error(f"Error processing query through orchestrator: {e}")
+                self.logger.error("Error processing query through orchestrator: %s", e)
                 response_data = {
                     "query": query,
                     "response": f"Error: {str(e)}",
@@ -162,25 +317,32 @@ class SystemEvaluator:
             }
 
         # Evaluate response using LLM-as-a-Judge
+        response_text = response_data.get("response", "")
+        sources = response_data.get("metadata", {}).get("sources", [])
         if use_multi_perspective:
-            evaluation = await self.judge.evaluate_multi_perspective(
-                query=query,
-                response=response_data.get("response", ""),
-                sources=response_data.get("metadata", {}).get("sources", []),
-                ground_truth=ground_truth
+            # Both perspectives are independent network-bound judge calls,
+            # so run them concurrently instead of back-to-back.
+            academic_result, practical_result = await asyncio.gather(
+                self._judge_with_cache(
+                    query, response_text, sources, ground_truth, "academic"
+                ),
+                self._judge_with_cache(
+                    query, response_text, sources, ground_truth, "practical"
+                )
+            )
+            evaluation = self.judge.combine_perspectives(
+                query, academic_result, practical_result
             )
         else:
-            evaluation = await self.judge.evaluate(
-                query=query,
-                response=response_data.get("response", ""),
-                sources=response_data.get("metadata", {}).get("sources", []),
-                ground_truth=ground_truth
+            evaluation = await self._judge_with_cache(
+                query, response_text, sources, ground_truth, "academic"
             )
 
         # Check topic coverage if expected topics provided
         topic_coverage = self._check_topic_coverage(
             response_data.get("response", ""),
-            expected_topics
+            expected_topics,
+            test_case.get("_expected_topics_lower")
         )
 
         return {
@@ -195,23 +357,99 @@ class SystemEvaluator:
             "topic_coverage": topic_coverage
         }
 
+    def _judge_cache_key(
+        self,
+        query: str,
+        response: str,
+        sources: List[Dict[str, Any]],
+        ground_truth: Optional[str],
+        perspective: str
+    ) -> str:
+        """Hash the full judge input (including criteria names) into a key."""
+        payload = json.dumps({
+            "q": query,
+            "r": response,
+            "s": sources,
+            "g": ground_truth,
+            "p": perspective,
+            "c": [c.get("name") for c in self.judge.criteria],
+        }, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    async def _judge_with_cache(
+        self,
+        query: str,
+        response: str,
+        sources: List[Dict[str, Any]],
+        ground_truth: Optional[str],
+        perspective: str
+    ) -> Dict[str, Any]:
+        """
+        Run a single-perspective judge call, consulting the verdict cache.
+
+        A hit returns the stored verdict without any LLM traffic; a miss
+        calls the judge and persists the verdict for future reruns.
+        """
+        if not self.use_judge_cache:
+            return await self.judge.evaluate(
+                query=query,
+                response=response,
+                sources=sources,
+                ground_truth=ground_truth,
+                perspective=perspective
+            )
+
+        key = self._judge_cache_key(query, response, sources, ground_truth, perspective)
+        cache_file = self._judge_cache_dir / f"{key}.json"
+        if cache_file.exists():
+            try:
+                return json.loads(cache_file.read_text())
+            except (OSError, json.JSONDecodeError) as e:
+                self.logger.warning("Failed to read judge cache entry: %s", e)
+
+        evaluation = await self.judge.evaluate(
+            query=query,
+            response=response,
+            sources=sources,
+            ground_truth=ground_truth,
+            perspective=perspective
+        )
+        try:
+            cache_file.write_text(json.dumps(evaluation, default=str))
+        except OSError as e:
+            self.logger.warning("Failed to write judge cache entry: %s", e)
+        return evaluation
+
     def _check_topic_coverage(
         self,
         response: str,
-        expected_topics: List[str]
+        expected_topics: List[str],
+        expected_topics_lower: Optional[List[str]] = None
     ) -> Dict[str, Any]:
         """
         Check how many expected topics are covered in the response.
+
+        Callers that loaded the test cases through _load_test_queries pass
+        the pre-lowercased topics so no per-scan .lower() calls remain.
         """
         if not expected_topics:
             return {"coverage_rate": 1.0, "covered": [], "missing": []}
 
+        # One fused scan over the response instead of one substring search
+        # per topic. Topics shadowed by a longer overlapping match fall back
+        # to an individual substring check, preserving the old semantics.
         response_lower = response.lower()
+        topics_lower = tuple(expected_topics_lower or (t.lower() for t in expected_topics))
+        hits = set(_topic_pattern(topics_lower).findall(response_lower))
+
+        # Single-word topics usually resolve against the token set in one
+        # hash lookup, skipping both the hit set and the substring fallback
+        words = set(_WORD_RE.findall(response_lower))
+
         covered = []
         missing = []
-
-        for topic in expected_topics:
-            if topic.lower() in response_lower:
+        for topic, topic_lower in zip(expected_topics, topics_lower):
+            if topic_lower in words or topic_lower in hits or topic_lower in response_lower:
                 covered.append(topic)
             else:
                 missing.append(topic)
@@ -231,17 +469,27 @@ class SystemEvaluator:
         """
         path_obj = Path(path)
         if not path_obj.exists():
-            self.logger.warning(f"Test queries file not found: {path}")
+            self.logger.warning("Test queries file not found: %s", path)
             return []
 
-        with open(path_obj, 'r') as f:
-            queries = json.load(f)
+        # orjson parses the whole file several times faster than stdlib json;
+        # with large query files this is startup latency
+        if orjson is not None:
+            queries = orjson.loads(path_obj.read_bytes())
+        else:
+            with open(path_obj, 'r') as f:
+                queries = json.load(f)
 
         # Limit number of queries if configured
         if self.max_test_queries and len(queries) > self.max_test_queries:
-            self.logger.info(f"Limiting to {self.max_test_queries} queries")
+            self.logger.info("Limiting to %d queries", self.max_test_queries)
             queries = queries[:self.max_test_queries]
 
+        # Expected topics are static per test case; lowercase them once here
+        # instead of on every coverage scan
+        for tc in queries:
+            tc["_expected_topics_lower"] = [t.lower() for t in tc.get("expected_topics", [])]
+
         return queries
 
     def _generate_report(self, use_multi_perspective: bool = True) -> Dict[str, Any]:
@@ -251,10 +499,12 @@ class SystemEvaluator:
         if not self.results:
             return {"error": "No results to report"}
 
-        # Basic statistics
+        # Basic statistics (one pass to partition instead of two scans)
         total_queries = len(self.results)
-        successful = [r for r in self.results if "error" not in r]
-        failed = [r for r in self.results if "error" in r]
+        # Failures are recorded in self.errors only; their results slot is
+        # None, so one identity filter yields the successful set
+        successful: List[Dict[str, Any]] = [r for r in self.results if r is not None]
+        failed_count = len(self.errors)
 
         # Aggregate scores
         if use_multi_perspective:
@@ -262,14 +512,12 @@ class SystemEvaluator:
         else:
             scores_data = self._aggregate_single_perspective_scores(successful)
 
-        # Category analysis
-        category_scores = self._analyze_by_category(successful)
-
-        # Topic coverage analysis
-        topic_analysis = self._analyze_topic_coverage(successful)
-
-        # Find best and worst
-        best_result, worst_result = self._find_extremes(successful, use_multi_perspective)
+        # Category, topic-coverage, and extremes analyses all read one fused
+        # pass over the successful results rather than re-walking the list
+        reduced = self._reduce(successful, use_multi_perspective)
+        category_scores = self._analyze_by_category(reduced)
+        topic_analysis = self._analyze_topic_coverage(reduced)
+        best_result, worst_result = self._find_extremes(reduced)
 
         # Generate interpretation
         interpretation = self._generate_interpretation(scores_data, category_scores, topic_analysis)
@@ -279,12 +527,12 @@ class SystemEvaluator:
             "configuration": {
                 "multi_perspective": use_multi_perspective,
                 "total_queries_available": total_queries,
-                "criteria_used": [c["name"] for c in self.judge.criteria]
+                "criteria_used": list(self._criterion_names)
             },
             "summary": {
                 "total_queries": total_queries,
                 "successful": len(successful),
-                "failed": len(failed),
+                "failed": failed_count,
                 "success_rate": len(successful) / total_queries if total_queries > 0 else 0.0
             },
             "scores": scores_data,
@@ -293,7 +541,8 @@ class SystemEvaluator:
             "best_result": best_result,
             "worst_result": worst_result,
             "interpretation": interpretation,
-            "detailed_results": self.results
+            "detailed_results_path": str(self._detailed_path) if self._detailed_path else None,
+            "detailed_results_count": len(self.results)
         }
 
         return report
@@ -303,41 +552,46 @@ class SystemEvaluator:
         combined_scores = []
         academic_scores = []
         practical_scores = []
-        criterion_scores = {"academic": {}, "practical": {}}
+        criterion_scores = {"academic": defaultdict(list), "practical": defaultdict(list)}
+
+        # Bind hot names once; the loop body then runs on local loads
+        # instead of repeated attribute and chained .get lookups
+        combined_append = combined_scores.append
+        academic_append = academic_scores.append
+        practical_append = practical_scores.append
+        academic_crit = criterion_scores["academic"]
+        practical_crit = criterion_scores["practical"]
 
         for result in results:
-            eval_data = result.get("evaluation", {})
+            eval_data = result.get("evaluation") or _EMPTY
 
             if "combined_score" in eval_data:
-                combined_scores.append(eval_data["combined_score"])
+                combined_append(eval_data["combined_score"])
+                perspectives = eval_data.get("perspectives") or _EMPTY
 
                 # Academic perspective
-                academic = eval_data.get("perspectives", {}).get("academic", {})
+                academic = perspectives.get("academic") or _EMPTY
                 if academic.get("overall_score"):
-                    academic_scores.append(academic["overall_score"])
-                    for crit, score_data in academic.get("criterion_scores", {}).items():
-                        if crit not in criterion_scores["academic"]:
-                            criterion_scores["academic"][crit] = []
-                        criterion_scores["academic"][crit].append(score_data.get("score", 0))
+                    academic_append(academic["overall_score"])
+                    for crit, score_data in (academic.get("criterion_scores") or _EMPTY).items():
+                        academic_crit[crit].append(score_data.get("score", 0))
 
                 # Practical perspective
-                practical = eval_data.get("perspectives", {}).get("practical", {})
+                practical = perspectives.get("practical") or _EMPTY
                 if practical.get("overall_score"):
-                    practical_scores.append(practical["overall_score"])
-                    for crit, score_data in practical.get("criterion_scores", {}).items():
-                        if crit not in criterion_scores["practical"]:
-                            criterion_scores["practical"][crit] = []
-                        criterion_scores["practical"][crit].append(score_data.get("score", 0))
+                    practical_append(practical["overall_score"])
+                    for crit, score_data in (practical.get("criterion_scores") or _EMPTY).items():
+                        practical_crit[crit].append(score_data.get("score", 0))
 
         # Calculate averages
-        avg_combined = sum(combined_scores) / len(combined_scores) if combined_scores else 0
-        avg_academic = sum(academic_scores) / len(academic_scores) if academic_scores else 0
-        avg_practical = sum(practical_scores) / len(practical_scores) if practical_scores else 0
+        avg_combined = self._mean(combined_scores)
+        avg_academic = self._mean(academic_scores)
+        avg_practical = self._mean(practical_scores)
 
         # Average by criterion for each perspective
         avg_by_criterion = {
-            "academic": {k: sum(v)/len(v) if v else 0 for k, v in criterion_scores["academic"].items()},
-            "practical": {k: sum(v)/len(v) if v else 0 for k, v in criterion_scores["practical"].items()}
+            "academic": {k: self._mean(v) for k, v in criterion_scores["academic"].items()},
+            "practical": {k: self._mean(v) for k, v in criterion_scores["practical"].items()}
         }
 
         return {
@@ -357,7 +611,7 @@ class SystemEvaluator:
     def _aggregate_single_perspective_scores(self, results: List[Dict]) -> Dict[str, Any]:
         """Aggregate scores from single-perspective evaluation."""
         overall_scores = []
-        criterion_scores = {}
+        criterion_scores: Dict[str, List[float]] = defaultdict(list)
 
         for result in results:
             eval_data = result.get("evaluation", {})
@@ -365,12 +619,10 @@ class SystemEvaluator:
                 overall_scores.append(eval_data["overall_score"])
 
             for crit, score_data in eval_data.get("criterion_scores", {}).items():
-                if crit not in criterion_scores:
-                    criterion_scores[crit] = []
                 criterion_scores[crit].append(score_data.get("score", 0))
 
-        avg_overall = sum(overall_scores) / len(overall_scores) if overall_scores else 0
-        avg_by_criterion = {k: sum(v)/len(v) if v else 0 for k, v in criterion_scores.items()}
+        avg_overall = self._mean(overall_scores)
+        avg_by_criterion = {k: self._mean(v) for k, v in criterion_scores.items()}
 
         return {
             "overall_average": avg_overall,
@@ -378,44 +630,112 @@ class SystemEvaluator:
             "score_distribution": self._calculate_distribution(overall_scores)
         }
 
+    @staticmethod
+    def _mean(values: List[float]) -> float:
+        """Average of a score list (vectorized when NumPy is available)."""
+        if not values:
+            return 0
+        if np is not None:
+            return float(np.asarray(values, dtype=np.float64).mean())
+        return sum(values) / len(values)
+
     def _calculate_distribution(self, scores: List[float]) -> Dict[str, Any]:
         """Calculate score distribution statistics."""
         if not scores:
             return {"min": 0, "max": 0, "median": 0, "std_dev": 0}
 
-        sorted_scores = sorted(scores)
-        n = len(sorted_scores)
+        if np is not None:
+            # One vectorized pass; outputs converted back to Python floats
+            # so report serialization is unchanged
+            arr = np.asarray(scores, dtype=np.float64)
+            return {
+                "min": float(arr.min()),
+                "max": float(arr.max()),
+                "mean": float(arr.mean()),
+                "median": float(np.median(arr)),
+                "std_dev": float(arr.std()),
+                "count": int(arr.size)
+            }
 
-        mean = sum(scores) / n
-        variance = sum((x - mean) ** 2 for x in scores) / n
-        std_dev = variance ** 0.5
+        # Welford's one-pass update gives mean/variance/min/max in a single
+        # sweep; only the median still needs the sorted copy
+        n = 0
+        mean = 0.0
+        m2 = 0.0
+        mn = float("inf")
+        mx = float("-inf")
+        for x in scores:
+            n += 1
+            delta = x - mean
+            mean += delta / n
+            m2 += delta * (x - mean)
+            if x < mn:
+                mn = x
+            if x > mx:
+                mx = x
+        std_dev = (m2 / n) ** 0.5
 
+        sorted_scores = sorted(scores)
         median = sorted_scores[n // 2] if n % 2 == 1 else (sorted_scores[n//2 - 1] + sorted_scores[n//2]) / 2
 
         return {
-            "min": min(scores),
-            "max": max(scores),
+            "min": mn,
+            "max": mx,
             "mean": mean,
             "median": median,
             "std_dev": std_dev,
             "count": n
         }
 
-    def _analyze_by_category(self, results: List[Dict]) -> Dict[str, Any]:
-        """Analyze scores by query category."""
-        category_results = {}
+    def _reduce(self, results: List[Dict], use_multi_perspective: bool = True) -> Dict[str, Any]:
+        """
+        Accumulate per-category scores, topic coverage, and score extremes in
+        a single forward pass over the successful results.
 
-        for result in results:
-            category = result.get("category", "general")
-            if category not in category_results:
-                category_results[category] = []
+        The per-section analyses below are thin readers of this state, so the
+        report costs one dict-lookup chain per result instead of one full
+        list walk per section.
+        """
+        per_category: Dict[str, List[float]] = defaultdict(list)
+        coverage_rates: List[float] = []
+        missing_counts: Counter = Counter()
+        best = worst = None
+        best_score = worst_score = None
+
+        # The perspective mode is fixed for the whole run, so resolve which
+        # score field to read once instead of branching per result
+        score_key = "combined_score" if use_multi_perspective else "overall_score"
 
+        for result in results:
             eval_data = result.get("evaluation", {})
-            score = eval_data.get("combined_score") or eval_data.get("overall_score", 0)
-            category_results[category].append(score)
+            score = eval_data.get(score_key) or eval_data.get("overall_score", 0)
+
+            per_category[result.get("category", "general")].append(score)
 
+            topic_cov = result.get("topic_coverage", {})
+            if topic_cov.get("coverage_rate") is not None:
+                coverage_rates.append(topic_cov["coverage_rate"])
+            missing_counts.update(topic_cov.get("missing", []))
+
+            if best_score is None or score > best_score:
+                best, best_score = result, score
+            if worst_score is None or score < worst_score:
+                worst, worst_score = result, score
+
+        return {
+            "per_category": per_category,
+            "coverage_rates": coverage_rates,
+            "missing_counts": missing_counts,
+            "best": best,
+            "best_score": best_score,
+            "worst": worst,
+            "worst_score": worst_score
+        }
+
+    def _analyze_by_category(self, reduced: Dict[str, Any]) -> Dict[str, Any]:
+        """Analyze scores by query category from the fused reduction pass."""
         category_stats = {}
-        for category, scores in category_results.items():
+        for category, scores in reduced["per_category"].items():
             category_stats[category] = {
                 "average": sum(scores) / len(scores) if scores else 0,
                 "count": len(scores),
@@ -425,44 +745,28 @@ class SystemEvaluator:
 
         return category_stats
 
-    def _analyze_topic_coverage(self, results: List[Dict]) -> Dict[str, Any]:
-        """Analyze topic coverage across all results."""
-        coverage_rates = []
-        all_missing = []
-
-        for result in results:
-            topic_cov = result.get("topic_coverage", {})
-            if topic_cov.get("coverage_rate") is not None:
-                coverage_rates.append(topic_cov["coverage_rate"])
-            all_missing.extend(topic_cov.get("missing", []))
-
-        # Find most commonly missed topics
-        missing_counts = {}
-        for topic in all_missing:
-            missing_counts[topic] = missing_counts.get(topic, 0) + 1
+    def _analyze_topic_coverage(self, reduced: Dict[str, Any]) -> Dict[str, Any]:
+        """Analyze topic coverage from the fused reduction pass."""
+        coverage_rates = reduced["coverage_rates"]
 
-        commonly_missed = sorted(missing_counts.items(), key=lambda x: x[1], reverse=True)[:5]
+        # Most commonly missed topics: most_common uses heapq.nlargest,
+        # O(K log 5) instead of sorting every unique topic
+        commonly_missed = reduced["missing_counts"].most_common(5)
 
         return {
             "average_coverage": sum(coverage_rates) / len(coverage_rates) if coverage_rates else 0,
             "commonly_missed_topics": commonly_missed
         }
 
-    def _find_extremes(self, results: List[Dict], use_multi_perspective: bool) -> tuple:
-        """Find best and worst performing queries."""
-        if not results:
+    def _find_extremes(self, reduced: Dict[str, Any]) -> tuple:
+        """Format best and worst performing queries from the reduction pass."""
+        best, worst = reduced["best"], reduced["worst"]
+        if best is None or worst is None:
             return None, None
 
-        def get_score(r):
-            eval_data = r.get("evaluation", {})
-            return eval_data.get("combined_score") or eval_data.get("overall_score", 0)
-
-        best = max(results, key=get_score)
-        worst = min(results, key=get_score)
-
         return (
-            {"query": best.get("query", ""), "score": get_score(best), "category": best.get("category")},
-            {"query": worst.get("query", ""), "score": get_score(worst), "category": worst.get("category")}
+            {"query": best.get("query", ""), "score": reduced["best_score"], "category": best.get("category")},
+            {"query": worst.get("query", ""), "score": reduced["worst_score"], "category": worst.get("category")}
         )
 
     def _analyze_errors(self) -> Dict[str, Any]:
@@ -473,10 +777,9 @@ class SystemEvaluator:
             return {"total_errors": 0, "patterns": [], "recommendations": []}
 
         # Count error types
-        error_types = {}
-        for error in self.errors:
-            error_type = error.get("error_type", "Unknown")
-            error_types[error_type] = error_types.get(error_type, 0) + 1
+        error_types = Counter(
+            error.get("error_type", "Unknown") for error in self.errors
+        )
 
         # Identify patterns
         patterns = []
@@ -492,12 +795,12 @@ class SystemEvaluator:
         if len(self.errors) > len(self.results) * 0.2:
             recommendations.append("High error rate (>20%) - review system configuration")
         if error_types:
-            most_common = max(error_types.items(), key=lambda x: x[1])
+            most_common = error_types.most_common(1)[0]
             recommendations.append(f"Focus on fixing {most_common[0]} errors ({most_common[1]} occurrences)")
 
         return {
             "total_errors": len(self.errors),
-            "error_types": error_types,
+            "error_types": dict(error_types),  # plain dict for serialization
             "patterns": patterns,
             "recommendations": recommendations,
             "error_details": self.errors[:5]  # First 5 errors for detail
@@ -576,94 +879,108 @@ class SystemEvaluator:
             ] if weaknesses else ["Maintain current performance levels"]
         }
 
-    def _save_results(self, report: Dict[str, Any]):
-        """Save evaluation results to files."""
+    async def _save_results(self, report: Dict[str, Any]):
+        """Save evaluation results to files.
+
+        Both writes run on worker threads and overlap each other, so the
+        event loop stays free while the JSON dump and summary render.
+        """
         output_dir = Path("outputs")
         output_dir.mkdir(exist_ok=True)
 
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-
-        # Save detailed JSON results
         results_file = output_dir / f"evaluation_{timestamp}.json"
-        with open(results_file, 'w') as f:
-            json.dump(report, f, indent=2, default=str)
-        self.logger.info(f"Evaluation results saved to {results_file}")
-
-        # Save human-readable summary
         summary_file = output_dir / f"evaluation_summary_{timestamp}.txt"
-        self._write_summary_file(summary_file, report)
-        self.logger.info(f"Summary saved to {summary_file}")
+
+        await asyncio.gather(
+            asyncio.to_thread(self._write_json_report, results_file, report),
+            asyncio.to_thread(self._write_summary_file, summary_file, report)
+        )
+        self.logger.info("Evaluation results saved to %s", results_file)
+        self.logger.info("Summary saved to %s", summary_file)
+
+    def _write_json_report(self, path: Path, report: Dict[str, Any]):
+        """Write the detailed JSON report."""
+        if orjson is not None:
+            with open(path, 'wb') as f:
+                f.write(orjson.dumps(report, option=orjson.OPT_INDENT_2, default=str))
+        else:
+            with open(path, 'w') as f:
+                json.dump(report, f, indent=2, default=str)
 
     def _write_summary_file(self, path: Path, report: Dict):
-        """Write human-readable summary file."""
-        with open(path, 'w') as f:
-            f.write("=" * 70 + "\n")
-            f.write("MULTI-AGENT SYSTEM EVALUATION REPORT\n")
-            f.write("=" * 70 + "\n\n")
-
-            f.write(f"Generated: {report.get('timestamp', 'N/A')}\n")
-            f.write(f"Multi-perspective evaluation: {report.get('configuration', {}).get('multi_perspective', False)}\n\n")
-
-            # Summary section
-            summary = report.get("summary", {})
-            f.write("SUMMARY\n")
-            f.write("-" * 40 + "\n")
-            f.write(f"Total Queries: {summary.get('total_queries', 0)}\n")
-            f.write(f"Successful: {summary.get('successful', 0)}\n")
-            f.write(f"Failed: {summary.get('failed', 0)}\n")
-            f.write(f"Success Rate: {summary.get('success_rate', 0):.1%}\n\n")
-
-            # Scores section
-            scores = report.get("scores", {})
-            f.write("SCORES\n")
-            f.write("-" * 40 + "\n")
-
-            if "combined_average" in scores:
-                f.write(f"Combined Average: {scores['combined_average']:.3f}\n")
-                f.write(f"Academic Perspective: {scores.get('by_perspective', {}).get('academic', 0):.3f}\n")
-                f.write(f"Practical Perspective: {scores.get('by_perspective', {}).get('practical', 0):.3f}\n")
-            else:
-                f.write(f"Overall Average: {scores.get('overall_average', 0):.3f}\n")
-
-            f.write("\nScores by Criterion:\n")
-            by_criterion = scores.get("by_criterion", {})
-            if "academic" in by_criterion:
-                f.write("  Academic Perspective:\n")
-                for crit, score in by_criterion["academic"].items():
-                    f.write(f"    {crit}: {score:.3f}\n")
-                f.write("  Practical Perspective:\n")
-                for crit, score in by_criterion["practical"].items():
-                    f.write(f"    {crit}: {score:.3f}\n")
-            else:
-                for crit, score in by_criterion.items():
-                    f.write(f"  {crit}: {score:.3f}\n")
-
-            # Interpretation section
-            interp = report.get("interpretation", {})
-            f.write("\nINTERPRETATION\n")
-            f.write("-" * 40 + "\n")
-            f.write(f"{interp.get('summary', 'N/A')}\n\n")
-
-            if interp.get("strengths"):
-                f.write("Strengths:\n")
-                for s in interp["strengths"]:
-                    f.write(f"  + {s}\n")
-
-            if interp.get("weaknesses"):
-                f.write("\nWeaknesses:\n")
-                for w in interp["weaknesses"]:
-                    f.write(f"  - {w}\n")
-
-            # Error analysis section
-            errors = report.get("error_analysis", {})
-            if errors.get("total_errors", 0) > 0:
-                f.write("\nERROR ANALYSIS\n")
-                f.write("-" * 40 + "\n")
-                f.write(f"Total Errors: {errors['total_errors']}\n")
-                for pattern in errors.get("patterns", []):
-                    f.write(f"  ! {pattern}\n")
-
-            f.write("\n" + "=" * 70 + "\n")
+        """Write human-readable summary file.
+
+        The summary is rendered into one in-memory buffer and written with a
+        single call instead of dozens of small f.write hops through the
+        buffered-IO layer.
+        """
+        buf = io.StringIO()
+        w = buf.write
+
+        w("=" * 70 + "\n")
+        w("MULTI-AGENT SYSTEM EVALUATION REPORT\n")
+        w("=" * 70 + "\n\n")
+
+        w(f"Generated: {report.get('timestamp', 'N/A')}\n")
+        w(f"Multi-perspective evaluation: {report.get('configuration', {}).get('multi_perspective', False)}\n\n")
+
+        # Summary section
+        summary = report.get("summary", {})
+        w("SUMMARY\n")
+        w("-" * 40 + "\n")
+        w(f"Total Queries: {summary.get('total_queries', 0)}\n")
+        w(f"Successful: {summary.get('successful', 0)}\n")
+        w(f"Failed: {summary.get('failed', 0)}\n")
+        w(f"Success Rate: {summary.get('success_rate', 0):.1%}\n\n")
+
+        # Scores section
+        scores = report.get("scores", {})
+        w("SCORES\n")
+        w("-" * 40 + "\n")
+
+        if "combined_average" in scores:
+            w(f"Combined Average: {scores['combined_average']:.3f}\n")
+            w(f"Academic Perspective: {scores.get('by_perspective', {}).get('academic', 0):.3f}\n")
+            w(f"Practical Perspective: {scores.get('by_perspective', {}).get('practical', 0):.3f}\n")
+        else:
+            w(f"Overall Average: {scores.get('overall_average', 0):.3f}\n")
+
+        w("\nScores by Criterion:\n")
+        by_criterion = scores.get("by_criterion", {})
+        if "academic" in by_criterion:
+            w("  Academic Perspective:\n")
+            w("".join(f"    {crit}: {score:.3f}\n" for crit, score in by_criterion["academic"].items()))
+            w("  Practical Perspective:\n")
+            w("".join(f"    {crit}: {score:.3f}\n" for crit, score in by_criterion["practical"].items()))
+        else:
+            w("".join(f"  {crit}: {score:.3f}\n" for crit, score in by_criterion.items()))
+
+        # Interpretation section
+        interp = report.get("interpretation", {})
+        w("\nINTERPRETATION\n")
+        w("-" * 40 + "\n")
+        w(f"{interp.get('summary', 'N/A')}\n\n")
+
+        if interp.get("strengths"):
+            w("Strengths:\n")
+            w("".join(f"  + {s}\n" for s in interp["strengths"]))
+
+        if interp.get("weaknesses"):
+            w("\nWeaknesses:\n")
+            w("".join(f"  - {wk}\n" for wk in interp["weaknesses"]))
+
+        # Error analysis section
+        errors = report.get("error_analysis", {})
+        if errors.get("total_errors", 0) > 0:
+            w("\nERROR ANALYSIS\n")
+            w("-" * 40 + "\n")
+            w(f"Total Errors: {errors['total_errors']}\n")
+            w("".join(f"  ! {pattern}\n" for pattern in errors.get("patterns", [])))
+
+        w("\n" + "=" * 70 + "\n")
+
+        path.write_text(buf.getvalue())
 
 
 async def run_evaluation_demo():
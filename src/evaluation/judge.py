@@ -17,20 +17,44 @@ Example usage:
 """
 
 from typing import Dict, Any, List, Optional, Tuple
+import asyncio
+import copy
+import hashlib
 import logging
 import json
 import os
+import re
+from collections import OrderedDict
+from pathlib import Path
 
-# Try to import both clients
+# The provider SDKs are heavy and only one is used per process, so they
+# are imported lazily in __init__ for the configured provider only
+
+# NumPy vectorizes the per-criterion agreement computation when combining
+# perspectives over large corpora; fall back to pure Python if unavailable
 try:
-    from groq import Groq
+    import numpy as np
 except ImportError:
-    Groq = None
+    np = None
 
+# orjson parses judgments in native code and fails fast on malformed
+# output, handing the rare bad case straight to the regex fallback
 try:
-    from openai import OpenAI
+    from orjson import loads as _loads
 except ImportError:
-    OpenAI = None
+    _loads = json.loads
+
+# Fallback score-extraction patterns, compiled once at import instead of on
+# every unparseable judgment
+_SCORE_PATTERNS = [
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r'"score":\s*([\d.]+)',
+        r'score[:\s]+(\d+\.?\d*)',
+        r'(\d+\.?\d*)\s*/\s*1\.0',
+        r'(\d+\.?\d*)\s*out of\s*1',
+    )
+]
 
 
 class LLMJudge:
@@ -57,11 +81,57 @@ class LLMJudge:
         self.provider = self.model_config.get("provider", "groq")
 
         # Load evaluation criteria from config.yaml (evaluation.criteria)
-        self.criteria = config.get("evaluation", {}).get("criteria", [])
-
-        # Initialize client based on provider
+        eval_config = config.get("evaluation", {})
+        self.criteria = eval_config.get("criteria", [])
+
+        # Optional on-disk cache of per-criterion judgments: reruns over an
+        # identical (query, response, criterion, perspective, model) tuple
+        # skip the API round-trip. Model name and temperature are part of
+        # the key so rubric or model swaps invalidate automatically.
+        self.cache_judgments = eval_config.get("cache_judgments", False)
+        self._cache_dir = Path(eval_config.get("criterion_cache_dir", "outputs/.judge_cache/criteria"))
+        if self.cache_judgments:
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
+
+        # Score all criteria in one LLM call per perspective instead of one
+        # call per criterion: the query/response context is sent once, so
+        # with five criteria this is ~5x fewer requests and a fraction of
+        # the input tokens. Falls back to per-criterion calls on bad JSON.
+        self.batch_criteria = eval_config.get("batch_criteria", False)
+
+        # Criteria judged with a single letter grade (A-E mapped to rubric
+        # bands) instead of full JSON: near-binary criteria like
+        # safety_compliance don't need prose reasoning, and a 1-token
+        # completion at temperature 0 is an order of magnitude cheaper
+        self._single_token_criteria = frozenset(eval_config.get("single_token_criteria", ()))
+
+        # Delta evaluation: agent refinement loops often re-judge a lightly
+        # edited response for the same query. When enough paragraph blocks
+        # match the previous submission, ask the judge to update the prior
+        # verdict against just the changed text instead of re-reading the
+        # whole response.
+        self.delta_eval = eval_config.get("delta_eval", False)
+        self.delta_overlap_threshold = eval_config.get("delta_overlap_threshold", 0.8)
+        self._sessions: Dict[Tuple[str, str], Dict[str, Any]] = {}
+
+        # In-process verdict cache: config sweeps often re-present identical
+        # (query, response) pairs, and this answers them without touching
+        # the disk cache or the API. LRU-bounded via OrderedDict.
+        self._inproc_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._inproc_cache_max = eval_config.get("inproc_cache_size", 10000)
+
+        # Cap concurrent judge API calls: the criterion and perspective
+        # fan-outs can otherwise burst past provider rate limits and trade
+        # the latency win for 429 retries
+        self._sem = asyncio.Semaphore(self.model_config.get("max_concurrency", 8))
+
+        # Initialize client based on provider, importing only its SDK
         self.client = None
         if self.provider == "openai":
+            try:
+                from openai import OpenAI
+            except ImportError:
+                OpenAI = None
             api_key = os.getenv("OPENAI_API_KEY")
             base_url = os.getenv("OPENAI_BASE_URL")
             if api_key and OpenAI:
@@ -69,6 +139,10 @@ class LLMJudge:
             else:
                 self.logger.warning("OPENAI_API_KEY not found or openai not installed")
         else:  # groq
+            try:
+                from groq import Groq
+            except ImportError:
+                Groq = None
             api_key = os.getenv("GROQ_API_KEY")
             if api_key and Groq:
                 self.client = Groq(api_key=api_key)
@@ -132,6 +206,90 @@ and whether the information helps solve actual problems. Be practical and result
             }
         }
 
+        # Rubric text and the static instruction tail never change after
+        # construction; render them once instead of per prompt
+        self._rubric_text = {
+            name: "\n".join(f"  {range_}: {desc}" for range_, desc in rubric.items())
+            for name, rubric in self.scoring_rubrics.items()
+        }
+        self._prompt_tail = """
+
+## Instructions
+1. Carefully read the response and evaluate it against the criterion
+2. Use the scoring rubric to determine an appropriate score
+3. Provide detailed reasoning for your score
+4. Be consistent and fair in your evaluation
+
+## Required Output Format (JSON)
+Respond ONLY with valid JSON in this exact format:
+```json
+{
+    "score": <float between 0.0 and 1.0>,
+    "reasoning": "<detailed explanation of your score, referencing specific parts of the response>"
+}
+```
+"""
+
+        # Single-template prompt assembly: one format_map call produces the
+        # whole multi-KB prompt instead of a chain of f-string appends
+        self._prompt_template = (
+            "Evaluate the following response for the criterion: **{criterion_name}**\n"
+            "\n"
+            "## Criterion Description\n"
+            "{description}\n"
+            "\n"
+            "## Scoring Rubric (0.0 to 1.0 scale)\n"
+            "{rubric}\n"
+            "\n"
+            "## Query\n"
+            "{query}\n"
+            "\n"
+            "## Response to Evaluate\n"
+            "{response}\n"
+            # Braces in the JSON example tail are doubled so format_map
+            # treats them as literals
+            "{optional_sources}{optional_gt}"
+            + self._prompt_tail.replace("{", "{{").replace("}", "}}")
+        )
+
+        # Bake one prompt builder per criterion: the criterion name,
+        # description, and rubric are fused into a static head at
+        # construction, so the hot path only joins the per-call pieces.
+        # Keyed by criterion alone since the user prompt does not vary by
+        # perspective - that lives in the system message.
+        self._prompt_builders = {}
+        for criterion in self.criteria:
+            name = criterion.get("name", "unknown")
+            static_head = (
+                f"Evaluate the following response for the criterion: **{name}**\n"
+                f"\n## Criterion Description\n{criterion.get('description', '')}\n"
+                f"\n## Scoring Rubric (0.0 to 1.0 scale)\n"
+                f"{self._rubric_text.get(name) or 'Use your judgment to score from 0.0 (worst) to 1.0 (best)'}\n"
+                f"\n## Query\n"
+            )
+            self._prompt_builders[name] = self._make_prompt_builder(static_head)
+
+        # Prompt-cache-friendly layout: providers discount repeated prompt
+        # prefixes, so put every invariant segment (perspective prompt, all
+        # rubrics, instructions) into one static system message and keep
+        # only the query/response/criterion in the user turn
+        self.prompt_cache = self.model_config.get("prompt_cache", False)
+        all_rubrics = "\n\n".join(
+            f"### {name}\n{text}" for name, text in self._rubric_text.items()
+        )
+        self._system_prefix = {
+            perspective: (
+                perspective_config["system_prompt"]
+                + "\n\nRUBRICS (0.0 to 1.0 scale):\n" + all_rubrics
+                + "\n\nINSTRUCTIONS:\n"
+                "1. Evaluate the response against the named criterion using its rubric\n"
+                "2. Provide detailed reasoning for your score\n"
+                "3. Respond ONLY with valid JSON: "
+                '{"score": <float between 0.0 and 1.0>, "reasoning": "<explanation>"}'
+            )
+            for perspective, perspective_config in self.perspectives.items()
+        }
+
         self.logger.info(f"LLMJudge initialized with {len(self.criteria)} criteria and {len(self.perspectives)} perspectives")
 
     async def evaluate(
@@ -155,8 +313,19 @@ and whether the information helps solve actual problems. Be practical and result
         Returns:
             Dictionary with scores for each criterion and overall score
         """
+        cache_key = hashlib.sha256(f"{perspective}|{query}|{response}".encode()).hexdigest()
+        cached = self._inproc_cache.get(cache_key)
+        if cached is not None:
+            self._inproc_cache.move_to_end(cache_key)
+            return copy.deepcopy(cached)
+
         self.logger.info(f"Evaluating response with {perspective} perspective")
 
+        if self.delta_eval:
+            delta_result = await self._try_delta_evaluate(query, response, perspective)
+            if delta_result is not None:
+                return delta_result
+
         results = {
             "query": query,
             "perspective": perspective,
@@ -168,21 +337,54 @@ and whether the information helps solve actual problems. Be practical and result
         total_weight = sum(c.get("weight", 1.0) for c in self.criteria)
         weighted_score = 0.0
 
-        # Evaluate each criterion
-        for criterion in self.criteria:
+        if self.batch_criteria:
+            batch_scores = await self._judge_all_criteria(
+                query, response, sources, ground_truth, perspective
+            )
+            if batch_scores is not None:
+                for criterion in self.criteria:
+                    criterion_name = criterion.get("name", "unknown")
+                    score = batch_scores[criterion_name]
+                    results["criterion_scores"][criterion_name] = score
+                    weighted_score += score.get("score", 0.0) * criterion.get("weight", 1.0)
+                results["overall_score"] = weighted_score / total_weight if total_weight > 0 else 0.0
+                self._inproc_cache[cache_key] = copy.deepcopy(results)
+                while len(self._inproc_cache) > self._inproc_cache_max:
+                    self._inproc_cache.popitem(last=False)
+                return results
+            self.logger.warning("Batched judgment failed to parse; falling back to per-criterion calls")
+
+        # Each criterion is an independent judge call, so fan them out and
+        # let the total latency track the slowest call rather than the sum
+        scores = await asyncio.gather(
+            *(
+                self._judge_criterion(
+                    criterion=criterion,
+                    query=query,
+                    response=response,
+                    sources=sources,
+                    ground_truth=ground_truth,
+                    perspective=perspective
+                )
+                for criterion in self.criteria
+            ),
+            return_exceptions=True
+        )
+
+        for criterion, score in zip(self.criteria, scores):
             criterion_name = criterion.get("name", "unknown")
             weight = criterion.get("weight", 1.0)
 
-            self.logger.info(f"Evaluating criterion: {criterion_name}")
-
-            score = await self._judge_criterion(
-                criterion=criterion,
-                query=query,
-                response=response,
-                sources=sources,
-                ground_truth=ground_truth,
-                perspective=perspective
-            )
+            if isinstance(score, BaseException):
+                # Mirror _judge_criterion's own error fallback so one failed
+                # call doesn't sink the whole perspective
+                self.logger.error(f"Error judging criterion {criterion_name}: {score}")
+                score = {
+                    "score": 0.5,
+                    "reasoning": f"Error during evaluation: {score}",
+                    "criterion": criterion_name,
+                    "perspective": perspective
+                }
 
             results["criterion_scores"][criterion_name] = score
             weighted_score += score.get("score", 0.0) * weight
@@ -190,8 +392,144 @@ and whether the information helps solve actual problems. Be practical and result
         # Calculate overall score
         results["overall_score"] = weighted_score / total_weight if total_weight > 0 else 0.0
 
+        if self.delta_eval:
+            self._store_session(query, response, perspective, results)
+
+        self._inproc_cache[cache_key] = copy.deepcopy(results)
+        while len(self._inproc_cache) > self._inproc_cache_max:
+            self._inproc_cache.popitem(last=False)
+
         return results
 
+    @staticmethod
+    def _response_blocks(response: str) -> Dict[str, str]:
+        """Hash each paragraph of a response, keeping the original text."""
+        return {
+            hashlib.sha256(block.encode()).hexdigest(): block
+            for block in (b.strip() for b in response.split("\n\n"))
+            if block
+        }
+
+    def _store_session(self, query: str, response: str, perspective: str, results: Dict[str, Any]):
+        """Remember this verdict so a lightly edited rerun can update it."""
+        self._sessions[(query, perspective)] = {
+            "blocks": self._response_blocks(response),
+            "verdict": results,
+        }
+
+    async def _try_delta_evaluate(
+        self,
+        query: str,
+        response: str,
+        perspective: str
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Re-score against the previous verdict when the response is a light
+        edit of the last one seen for this query and perspective.
+
+        Returns None when there is no session, the overlap is below the
+        threshold, or the delta judgment fails - callers then run the full
+        evaluation path.
+        """
+        session = self._sessions.get((query, perspective))
+        if session is None:
+            return None
+
+        new_blocks = self._response_blocks(response)
+        old_keys = set(session["blocks"])
+        new_keys = set(new_blocks)
+        union = old_keys | new_keys
+        if not union:
+            return None
+
+        overlap = len(old_keys & new_keys) / len(union)
+        if old_keys == new_keys:
+            # Identical content - the previous verdict stands as-is
+            return session["verdict"]
+        if overlap < self.delta_overlap_threshold:
+            return None
+
+        changed_text = "\n\n".join(
+            new_blocks[key] for key in new_blocks if key not in old_keys
+        )
+        result = await self._judge_delta(query, session["verdict"], changed_text, perspective)
+        if result is not None:
+            self._sessions[(query, perspective)] = {
+                "blocks": new_blocks,
+                "verdict": result,
+            }
+        return result
+
+    async def _judge_delta(
+        self,
+        query: str,
+        prev_verdict: Dict[str, Any],
+        changed_text: str,
+        perspective: str
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Ask the judge to update a previous verdict against only the changed
+        paragraphs, in the same JSON shape as the batched judgment.
+        """
+        prev_scores = {
+            name: {"score": data.get("score"), "reasoning": data.get("reasoning", "")[:200]}
+            for name, data in prev_verdict.get("criterion_scores", {}).items()
+        }
+
+        criteria_names = [c.get("name", "unknown") for c in self.criteria]
+        example = ",\n".join(
+            f'    "{name}": {{"score": <float between 0.0 and 1.0>, "reasoning": "<explanation>"}}'
+            for name in criteria_names
+        )
+        prompt = f"""A response you previously evaluated has been lightly edited. Update your scores.
+
+## Query
+{query}
+
+## Your Previous Scores
+{json.dumps(prev_scores, indent=2)}
+
+## New or Changed Paragraphs
+{changed_text if changed_text else "(paragraphs were removed or reordered; no new text)"}
+
+## Instructions
+1. Keep scores for criteria the edit does not affect
+2. Adjust scores for criteria the changed text improves or worsens
+3. Provide reasoning for every score
+
+## Required Output Format (JSON)
+Respond ONLY with valid JSON in this exact format, with one entry per criterion:
+```json
+{{
+{example}
+}}
+```
+"""
+
+        try:
+            judgment = await self._call_judge_llm(prompt, perspective)
+        except Exception as e:
+            self.logger.error(f"Error in delta judgment: {e}")
+            return None
+
+        scores = self._parse_score_map(judgment, perspective)
+        if scores is None:
+            return None
+
+        total_weight = sum(c.get("weight", 1.0) for c in self.criteria)
+        weighted_score = sum(
+            scores[c.get("name", "unknown")]["score"] * c.get("weight", 1.0)
+            for c in self.criteria
+        )
+
+        return {
+            "query": query,
+            "perspective": perspective,
+            "overall_score": weighted_score / total_weight if total_weight > 0 else 0.0,
+            "criterion_scores": scores,
+            "feedback": [],
+        }
+
     async def evaluate_multi_perspective(
         self,
         query: str,
@@ -216,15 +554,36 @@ and whether the information helps solve actual problems. Be practical and result
         """
         self.logger.info("Evaluating response with multiple perspectives")
 
-        # Evaluate from both perspectives
-        academic_result = await self.evaluate(
-            query, response, sources, ground_truth, perspective="academic"
+        # Both perspectives are independent judge runs; overlap them so the
+        # multi-perspective pass costs one perspective's latency, not two
+        academic_result, practical_result = await asyncio.gather(
+            self.evaluate(query, response, sources, ground_truth, perspective="academic"),
+            self.evaluate(query, response, sources, ground_truth, perspective="practical")
         )
 
-        practical_result = await self.evaluate(
-            query, response, sources, ground_truth, perspective="practical"
-        )
+        return self.combine_perspectives(query, academic_result, practical_result)
+
+    def combine_perspectives(
+        self,
+        query: str,
+        academic_result: Dict[str, Any],
+        practical_result: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Combine academic and practical evaluation results into one report.
 
+        Split out from evaluate_multi_perspective so callers that run the
+        two perspectives concurrently can still produce the same combined
+        structure.
+
+        Args:
+            query: The original query
+            academic_result: Result from evaluate(..., perspective="academic")
+            practical_result: Result from evaluate(..., perspective="practical")
+
+        Returns:
+            Dictionary with scores from both perspectives and combined score
+        """
         # Combine results
         combined_score = (
             academic_result["overall_score"] * 0.5 +
@@ -235,12 +594,27 @@ and whether the information helps solve actual problems. Be practical and result
         agreements = []
         disagreements = []
 
-        for criterion in self.criteria:
-            name = criterion.get("name", "unknown")
-            academic_score = academic_result["criterion_scores"].get(name, {}).get("score", 0)
-            practical_score = practical_result["criterion_scores"].get(name, {}).get("score", 0)
+        names = [c.get("name", "unknown") for c in self.criteria]
+        academic_scores = [
+            academic_result["criterion_scores"].get(name, {}).get("score", 0) for name in names
+        ]
+        practical_scores = [
+            practical_result["criterion_scores"].get(name, {}).get("score", 0) for name in names
+        ]
+
+        if np is not None and names:
+            # One vectorized diff over all criteria; float() conversions keep
+            # the output JSON-serializable
+            diffs = np.abs(
+                np.asarray(academic_scores, dtype=np.float64)
+                - np.asarray(practical_scores, dtype=np.float64)
+            )
+        else:
+            diffs = [abs(a - p) for a, p in zip(academic_scores, practical_scores)]
 
-            diff = abs(academic_score - practical_score)
+        for name, academic_score, practical_score, diff in zip(
+            names, academic_scores, practical_scores, diffs
+        ):
             if diff < 0.2:
                 agreements.append({
                     "criterion": name,
@@ -252,7 +626,7 @@ and whether the information helps solve actual problems. Be practical and result
                     "criterion": name,
                     "academic": academic_score,
                     "practical": practical_score,
-                    "difference": diff
+                    "difference": float(diff)
                 })
 
         return {
@@ -295,21 +669,50 @@ and whether the information helps solve actual problems. Be practical and result
         criterion_name = criterion.get("name", "unknown")
         description = criterion.get("description", "")
 
+        cache_file = None
+        if self.cache_judgments:
+            key = self._judgment_cache_key(
+                query, response, sources, ground_truth, criterion_name, perspective
+            )
+            cache_file = self._cache_dir / f"{key}.json"
+            if cache_file.exists():
+                try:
+                    return json.loads(cache_file.read_text())
+                except (OSError, json.JSONDecodeError) as e:
+                    self.logger.warning(f"Failed to read judgment cache entry: {e}")
+
+        single_token = criterion_name in self._single_token_criteria
+
         # Create judge prompt with perspective and detailed rubric
-        prompt = self._create_judge_prompt(
-            criterion_name=criterion_name,
-            description=description,
-            query=query,
-            response=response,
-            sources=sources,
-            ground_truth=ground_truth,
-            perspective=perspective
-        )
+        if single_token:
+            prompt = self._create_letter_grade_prompt(
+                criterion_name, description, query, response
+            )
+        elif self.prompt_cache:
+            # The static prefix rides in the system message; only the
+            # variable parts are sent here, so the provider's prefix cache
+            # hits on every call
+            prompt = f"CRITERION: {criterion_name}\n\nQUERY:\n{query}\n\nRESPONSE:\n{response}\n"
+            if ground_truth:
+                prompt += f"\nEXPECTED/GROUND TRUTH RESPONSE:\n{ground_truth}\n"
+        else:
+            prompt = self._create_judge_prompt(
+                criterion_name=criterion_name,
+                description=description,
+                query=query,
+                response=response,
+                sources=sources,
+                ground_truth=ground_truth,
+                perspective=perspective
+            )
 
         # Call LLM API to get judgment
         try:
-            judgment = await self._call_judge_llm(prompt, perspective)
-            score_value, reasoning = self._parse_judgment(judgment)
+            judgment = await self._call_judge_llm(prompt, perspective, single_token=single_token)
+            if single_token:
+                score_value, reasoning = self._parse_letter_grade(judgment)
+            else:
+                score_value, reasoning = self._parse_judgment(judgment)
 
             score = {
                 "score": score_value,
@@ -317,6 +720,14 @@ and whether the information helps solve actual problems. Be practical and result
                 "criterion": criterion_name,
                 "perspective": perspective
             }
+            if cache_file is not None:
+                try:
+                    # Write-then-rename so a crash never leaves a torn entry
+                    tmp = cache_file.with_suffix(".tmp")
+                    tmp.write_text(json.dumps(score))
+                    tmp.rename(cache_file)
+                except OSError as e:
+                    self.logger.warning(f"Failed to write judgment cache entry: {e}")
         except Exception as e:
             self.logger.error(f"Error judging criterion {criterion_name}: {e}")
             score = {
@@ -328,30 +739,123 @@ and whether the information helps solve actual problems. Be practical and result
 
         return score
 
-    def _create_judge_prompt(
+    def _judgment_cache_key(
         self,
-        criterion_name: str,
-        description: str,
         query: str,
         response: str,
         sources: Optional[List[Dict[str, Any]]],
         ground_truth: Optional[str],
-        perspective: str = "academic"
+        criterion_name: str,
+        perspective: str
     ) -> str:
+        """Hash every input that affects a criterion judgment into a key."""
+        payload = json.dumps({
+            "q": query,
+            "r": response,
+            "s": len(sources) if sources else 0,
+            "gt": ground_truth,
+            "c": criterion_name,
+            "p": perspective,
+            "model": self.model_config.get("name"),
+            "temperature": self.model_config.get("temperature"),
+        }, sort_keys=True)
+        return hashlib.sha256(payload.encode()).hexdigest()[:32]
+
+    async def _judge_all_criteria(
+        self,
+        query: str,
+        response: str,
+        sources: Optional[List[Dict[str, Any]]],
+        ground_truth: Optional[str],
+        perspective: str
+    ) -> Optional[Dict[str, Dict[str, Any]]]:
         """
-        Create a detailed prompt for the judge LLM with scoring rubric.
+        Score every criterion in a single LLM call.
+
+        Returns a mapping of criterion name to the usual score dict, or None
+        when the call fails or the JSON is missing criteria, in which case
+        the caller retries with the per-criterion path.
         """
-        # Get rubric for this criterion
-        rubric = self.scoring_rubrics.get(criterion_name, {})
-        rubric_text = "\n".join([f"  {range_}: {desc}" for range_, desc in rubric.items()])
+        prompt = self._create_batch_judge_prompt(query, response, sources, ground_truth)
 
-        prompt = f"""Evaluate the following response for the criterion: **{criterion_name}**
+        try:
+            judgment = await self._call_judge_llm(prompt, perspective)
+        except Exception as e:
+            self.logger.error(f"Error in batched judgment: {e}")
+            return None
 
-## Criterion Description
-{description}
+        return self._parse_score_map(judgment, perspective)
+
+    def _parse_score_map(self, judgment: str, perspective: str) -> Optional[Dict[str, Dict[str, Any]]]:
+        """
+        Parse a JSON object keyed by criterion name into score dicts.
+
+        Returns None when the JSON is malformed or any criterion is missing,
+        so callers can fall back to the per-criterion path.
+        """
+        # Strip markdown fences the same way _parse_judgment does
+        judgment_clean = judgment.strip()
+        if judgment_clean.startswith("```json"):
+            judgment_clean = judgment_clean[7:]
+        elif judgment_clean.startswith("```"):
+            judgment_clean = judgment_clean[3:]
+        if judgment_clean.endswith("```"):
+            judgment_clean = judgment_clean[:-3]
+
+        try:
+            parsed = _loads(judgment_clean.strip())
+        except json.JSONDecodeError as e:
+            self.logger.error(f"JSON decode error in batched judgment: {e}")
+            return None
+
+        if not isinstance(parsed, dict):
+            return None
+
+        scores = {}
+        for criterion in self.criteria:
+            criterion_name = criterion.get("name", "unknown")
+            entry = parsed.get(criterion_name)
+            if not isinstance(entry, dict) or "score" not in entry:
+                # Partial answer - let the per-criterion path redo the work
+                return None
+            try:
+                score_value = max(0.0, min(1.0, float(entry["score"])))
+            except (TypeError, ValueError):
+                return None
+            scores[criterion_name] = {
+                "score": score_value,
+                "reasoning": entry.get("reasoning", "No reasoning provided"),
+                "criterion": criterion_name,
+                "perspective": perspective
+            }
+
+        return scores
+
+    def _create_batch_judge_prompt(
+        self,
+        query: str,
+        response: str,
+        sources: Optional[List[Dict[str, Any]]],
+        ground_truth: Optional[str]
+    ) -> str:
+        """
+        Create one prompt covering every criterion, sharing the query and
+        response context across all of them.
+        """
+        criteria_sections = []
+        for criterion in self.criteria:
+            criterion_name = criterion.get("name", "unknown")
+            rubric_text = self._rubric_text.get(criterion_name, "")
+            criteria_sections.append(
+                f"### {criterion_name}\n"
+                f"{criterion.get('description', '')}\n"
+                f"{rubric_text if rubric_text else 'Score from 0.0 (worst) to 1.0 (best)'}"
+            )
 
-## Scoring Rubric (0.0 to 1.0 scale)
-{rubric_text if rubric_text else "Use your judgment to score from 0.0 (worst) to 1.0 (best)"}
+        prompt = f"""Evaluate the following response against EVERY criterion listed below.
+
+## Criteria and Scoring Rubrics (0.0 to 1.0 scale)
+{chr(10).join(criteria_sections)}
 
 ## Query
 {query}
@@ -361,35 +865,145 @@ and whether the information helps solve actual problems. Be practical and result
 """
 
         if sources and len(sources) > 0:
-            source_summary = f"\n## Sources Provided\n{len(sources)} sources were used in generating this response."
-            prompt += source_summary
+            prompt += f"\n## Sources Provided\n{len(sources)} sources were used in generating this response."
 
         if ground_truth:
             prompt += f"\n## Expected/Ground Truth Response\n{ground_truth}"
 
-        prompt += """
+        criteria_names = [c.get("name", "unknown") for c in self.criteria]
+        example = ",\n".join(
+            f'    "{name}": {{"score": <float between 0.0 and 1.0>, "reasoning": "<explanation>"}}'
+            for name in criteria_names
+        )
+        prompt += f"""
 
 ## Instructions
-1. Carefully read the response and evaluate it against the criterion
-2. Use the scoring rubric to determine an appropriate score
-3. Provide detailed reasoning for your score
-4. Be consistent and fair in your evaluation
+1. Evaluate the response against each criterion independently
+2. Use the scoring rubrics to determine appropriate scores
+3. Provide detailed reasoning for every score
 
 ## Required Output Format (JSON)
-Respond ONLY with valid JSON in this exact format:
+Respond ONLY with valid JSON in this exact format, with one entry per criterion:
 ```json
-{
-    "score": <float between 0.0 and 1.0>,
-    "reasoning": "<detailed explanation of your score, referencing specific parts of the response>"
-}
+{{
+{example}
+}}
 ```
 """
 
         return prompt
 
-    async def _call_judge_llm(self, prompt: str, perspective: str = "academic") -> str:
+    # Letter grades map to the midpoints of the rubric's five score bands
+    _LETTER_SCORES = {"A": 0.1, "B": 0.3, "C": 0.5, "D": 0.7, "E": 0.9}
+
+    def _create_letter_grade_prompt(
+        self,
+        criterion_name: str,
+        description: str,
+        query: str,
+        response: str
+    ) -> str:
+        """
+        Create a single-token prompt: the model answers with one letter
+        mapped to a rubric band instead of a JSON object with reasoning.
+        """
+        rubric = self.scoring_rubrics.get(criterion_name, {})
+        bands = "\n".join(
+            f"{letter} ({range_}): {desc}"
+            for letter, (range_, desc) in zip("ABCDE", rubric.items())
+        ) if rubric else "A (worst) through E (best)"
+
+        return f"""Grade the following response for the criterion: **{criterion_name}**
+
+## Criterion Description
+{description}
+
+## Grade Bands
+{bands}
+
+## Query
+{query}
+
+## Response to Evaluate
+{response}
+
+Reply with ONLY one character: A, B, C, D, or E."""
+
+    def _parse_letter_grade(self, judgment: str) -> Tuple[float, str]:
+        """Map a letter-grade judgment to its band midpoint score."""
+        for char in judgment.strip().upper():
+            if char in self._LETTER_SCORES:
+                return self._LETTER_SCORES[char], f"Letter grade: {char}"
+        self.logger.warning(f"Unparseable letter grade: {judgment[:20]!r}")
+        return 0.5, f"Could not parse letter grade, defaulting to 0.5. Raw: {judgment[:50]}"
+
+    def _make_prompt_builder(self, static_head: str):
+        """Close over a criterion's static prompt head and the shared tail."""
+        tail = self._prompt_tail
+
+        def _build(
+            query: str,
+            response: str,
+            sources: Optional[List[Dict[str, Any]]],
+            ground_truth: Optional[str]
+        ) -> str:
+            parts = [static_head, query, "\n\n## Response to Evaluate\n", response, "\n"]
+            if sources:
+                parts.append(f"\n## Sources Provided\n{len(sources)} sources were used in generating this response.")
+            if ground_truth:
+                parts.append(f"\n## Expected/Ground Truth Response\n{ground_truth}")
+            parts.append(tail)
+            return "".join(parts)
+
+        return _build
+
+    def _create_judge_prompt(
+        self,
+        criterion_name: str,
+        description: str,
+        query: str,
+        response: str,
+        sources: Optional[List[Dict[str, Any]]],
+        ground_truth: Optional[str],
+        perspective: str = "academic"
+    ) -> str:
+        """
+        Create a detailed prompt for the judge LLM with scoring rubric.
+        """
+        builder = self._prompt_builders.get(criterion_name)
+        if builder is not None:
+            return builder(query, response, sources, ground_truth)
+
+        return self._prompt_template.format_map({
+            "criterion_name": criterion_name,
+            "description": description,
+            # Rubric text is pre-rendered at construction
+            "rubric": self._rubric_text.get(criterion_name)
+            or "Use your judgment to score from 0.0 (worst) to 1.0 (best)",
+            "query": query,
+            "response": response,
+            "optional_sources": (
+                f"\n## Sources Provided\n{len(sources)} sources were used in generating this response."
+                if sources else ""
+            ),
+            "optional_gt": (
+                f"\n## Expected/Ground Truth Response\n{ground_truth}"
+                if ground_truth else ""
+            ),
+        })
+
+    async def _call_judge_llm(
+        self,
+        prompt: str,
+        perspective: str = "academic",
+        single_token: bool = False
+    ) -> str:
         """
         Call LLM API to get judgment with perspective-specific system prompt.
+
+        With single_token=True the completion is capped at a couple of
+        tokens at temperature 0 and JSON mode is skipped - used for the
+        letter-grade fast path.
         """
         if not self.client:
             raise ValueError(f"LLM client not initialized. Check API keys for provider: {self.provider}")
@@ -400,30 +1014,63 @@ Respond ONLY with valid JSON in this exact format:
             temperature = self.model_config.get("temperature", 0.3)
             max_tokens = self.model_config.get("max_tokens", 1024)
 
-            # Get perspective-specific system prompt
-            perspective_config = self.perspectives.get(perspective, self.perspectives["academic"])
-            system_prompt = perspective_config["system_prompt"]
+            # Get perspective-specific system prompt; with prompt caching
+            # enabled this is the full static prefix shared across calls
+            if self.prompt_cache and not single_token:
+                system_prompt = self._system_prefix.get(perspective, self._system_prefix["academic"])
+            else:
+                perspective_config = self.perspectives.get(perspective, self.perspectives["academic"])
+                system_prompt = perspective_config["system_prompt"]
 
             self.logger.debug(f"Calling {self.provider} API with model: {model_name}, perspective: {perspective}")
 
-            # Call LLM API (works for both OpenAI and Groq since they have compatible APIs)
-            chat_completion = self.client.chat.completions.create(
-                messages=[
-                    {
-                        "role": "system",
-                        "content": system_prompt + "\n\nAlways respond with valid JSON format."
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
-                model=model_name,
-                temperature=temperature,
-                max_tokens=max_tokens,
-            )
+            # Call LLM API (works for both OpenAI and Groq since they have
+            # compatible APIs). The SDK call is synchronous, so run it on a
+            # worker thread — otherwise it blocks the event loop and the
+            # gather-based fan-outs above silently serialize.
+            # JSON mode makes the provider guarantee parseable output, so
+            # the fence-strip and regex fallback become dead paths in the
+            # common case. Both OpenAI and Groq accept response_format.
+            extra = {}
+            if single_token:
+                temperature = 0
+                max_tokens = 2
+            elif self.model_config.get("json_mode", True):
+                extra["response_format"] = {"type": "json_object"}
+
+            messages = [
+                {
+                    "role": "system",
+                    "content": system_prompt + "\n\nAlways respond with valid JSON format."
+                },
+                {
+                    "role": "user",
+                    "content": prompt
+                }
+            ]
+
+            use_stream = self.model_config.get("stream", False) and not single_token
+
+            async with self._sem:
+                if use_stream:
+                    # Stream the completion and stop reading as soon as the
+                    # top-level JSON object closes: parsing overlaps with
+                    # network receive and trailing tokens are never paid for
+                    response = await asyncio.to_thread(
+                        self._stream_judgment,
+                        messages, model_name, temperature, max_tokens, extra
+                    )
+                else:
+                    chat_completion = await asyncio.to_thread(
+                        self.client.chat.completions.create,
+                        messages=messages,
+                        model=model_name,
+                        temperature=temperature,
+                        max_tokens=max_tokens,
+                        **extra,
+                    )
+                    response = chat_completion.choices[0].message.content
 
-            response = chat_completion.choices[0].message.content
             self.logger.debug(f"Received response: {response[:100]}...")
 
             return response
@@ -432,6 +1079,62 @@ Respond ONLY with valid JSON in this exact format:
             self.logger.error(f"Error calling Groq API: {e}")
             raise
 
+    def _stream_judgment(
+        self,
+        messages: List[Dict[str, str]],
+        model_name: str,
+        temperature: float,
+        max_tokens: int,
+        extra: Dict[str, Any]
+    ) -> str:
+        """
+        Consume a streamed completion, closing the stream once the judgment
+        JSON object is complete.
+
+        Runs synchronously on a worker thread; tracks brace depth outside
+        string literals so a stray brace in the reasoning text doesn't end
+        the scan early.
+        """
+        stream = self.client.chat.completions.create(
+            messages=messages,
+            model=model_name,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            stream=True,
+            **extra,
+        )
+
+        parts: List[str] = []
+        depth = 0
+        started = False
+        in_string = False
+        escaped = False
+        try:
+            for chunk in stream:
+                delta = chunk.choices[0].delta.content if chunk.choices else None
+                if not delta:
+                    continue
+                parts.append(delta)
+                for char in delta:
+                    if escaped:
+                        escaped = False
+                    elif char == "\\" and in_string:
+                        escaped = True
+                    elif char == '"':
+                        in_string = not in_string
+                    elif not in_string:
+                        if char == "{":
+                            depth += 1
+                            started = True
+                        elif char == "}":
+                            depth -= 1
+                if started and depth <= 0:
+                    break
+        finally:
+            stream.close()
+
+        return "".join(parts)
+
     def _parse_judgment(self, judgment: str) -> Tuple[float, str]:
         """
         Parse LLM judgment response into score and reasoning.
@@ -447,8 +1150,9 @@ Respond ONLY with valid JSON in this exact format:
                 judgment_clean = judgment_clean[:-3]
             judgment_clean = judgment_clean.strip()
 
-            # Parse JSON
-            result = json.loads(judgment_clean)
+            # Parse JSON (orjson when available; the fence strip above stays
+            # because orjson does not tolerate markdown fences)
+            result = _loads(judgment_clean)
             score = float(result.get("score", 0.5))
             reasoning = result.get("reasoning", "No reasoning provided")
 
@@ -470,18 +1174,9 @@ Respond ONLY with valid JSON in this exact format:
         """
         Fallback: Try to extract a score from unstructured text.
         """
-        import re
-
         # Look for patterns like "score: 0.7" or "0.8/1.0"
-        patterns = [
-            r'"score":\s*([\d.]+)',
-            r'score[:\s]+(\d+\.?\d*)',
-            r'(\d+\.?\d*)\s*/\s*1\.0',
-            r'(\d+\.?\d*)\s*out of\s*1',
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in _SCORE_PATTERNS:
+            match = pattern.search(text)
             if match:
                 try:
                     score = float(match.group(1))
@@ -495,6 +1190,131 @@ Respond ONLY with valid JSON in this exact format:
         # Default fallback
         return 0.5, f"Could not parse judgment, defaulting to 0.5. Raw: {text[:100]}..."
 
+    async def evaluate_corpus(
+        self,
+        pairs: List[Dict[str, Any]],
+        poll_interval_s: float = 30.0
+    ) -> List[Dict[str, Any]]:
+        """
+        Score a corpus of (query, response) pairs through the provider's
+        Batch API instead of interactive calls.
+
+        Offline eval runs don't need sub-second latency, and batch requests
+        cost half as much with far higher rate ceilings. Each pair is judged
+        from both perspectives with the consolidated all-criteria prompt.
+        Only the OpenAI provider exposes a Batch API; other providers fall
+        back to the interactive multi-perspective path.
+
+        Args:
+            pairs: List of dicts with "query", "response", and optionally
+                "sources" and "ground_truth"
+            poll_interval_s: Seconds between batch status polls
+
+        Returns:
+            One combined multi-perspective result per input pair
+        """
+        if self.provider != "openai" or not self.client:
+            self.logger.warning("Batch API unavailable for provider %s; using interactive calls", self.provider)
+            return list(await asyncio.gather(*(
+                self.evaluate_multi_perspective(
+                    p.get("query", ""), p.get("response", ""),
+                    p.get("sources"), p.get("ground_truth")
+                )
+                for p in pairs
+            )))
+
+        model_name = self.model_config.get("name", "gpt-4o-mini")
+        temperature = self.model_config.get("temperature", 0.3)
+        max_tokens = self.model_config.get("max_tokens", 1024)
+
+        # One request per (pair, perspective); criteria ride together in the
+        # consolidated prompt so the corpus costs 2 requests per pair
+        lines = []
+        for i, pair in enumerate(pairs):
+            prompt = self._create_batch_judge_prompt(
+                pair.get("query", ""), pair.get("response", ""),
+                pair.get("sources"), pair.get("ground_truth")
+            )
+            for perspective, perspective_config in self.perspectives.items():
+                lines.append(json.dumps({
+                    "custom_id": f"{i}|{perspective}",
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": {
+                        "model": model_name,
+                        "temperature": temperature,
+                        "max_tokens": max_tokens,
+                        "messages": [
+                            {
+                                "role": "system",
+                                "content": perspective_config["system_prompt"] + "\n\nAlways respond with valid JSON format."
+                            },
+                            {"role": "user", "content": prompt}
+                        ]
+                    }
+                }))
+
+        batch_input = await asyncio.to_thread(
+            self.client.files.create,
+            file=("judge_batch.jsonl", "\n".join(lines).encode()),
+            purpose="batch"
+        )
+        batch = await asyncio.to_thread(
+            self.client.batches.create,
+            input_file_id=batch_input.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+        self.logger.info("Submitted judge batch %s with %d requests", batch.id, len(lines))
+
+        while batch.status not in ("completed", "failed", "expired", "cancelled"):
+            await asyncio.sleep(poll_interval_s)
+            batch = await asyncio.to_thread(self.client.batches.retrieve, batch.id)
+
+        if batch.status != "completed":
+            raise RuntimeError(f"Judge batch {batch.id} ended with status {batch.status}")
+
+        output = await asyncio.to_thread(self.client.files.content, batch.output_file_id)
+
+        # Reassemble per-pair, per-perspective verdicts
+        total_weight = sum(c.get("weight", 1.0) for c in self.criteria)
+        per_pair: Dict[int, Dict[str, Dict[str, Any]]] = {}
+        for line in output.text.splitlines():
+            if not line.strip():
+                continue
+            entry = json.loads(line)
+            index_str, perspective = entry["custom_id"].split("|")
+            content = entry["response"]["body"]["choices"][0]["message"]["content"]
+            scores = self._parse_score_map(content, perspective)
+            if scores is None:
+                self.logger.warning("Unparseable batch judgment for pair %s (%s)", index_str, perspective)
+                continue
+            weighted = sum(
+                scores[c.get("name", "unknown")]["score"] * c.get("weight", 1.0)
+                for c in self.criteria
+            )
+            per_pair.setdefault(int(index_str), {})[perspective] = {
+                "query": pairs[int(index_str)].get("query", ""),
+                "perspective": perspective,
+                "overall_score": weighted / total_weight if total_weight > 0 else 0.0,
+                "criterion_scores": scores,
+                "feedback": [],
+            }
+
+        results = []
+        for i, pair in enumerate(pairs):
+            verdicts = per_pair.get(i, {})
+            academic = verdicts.get("academic")
+            practical = verdicts.get("practical")
+            if academic and practical:
+                results.append(self.combine_perspectives(pair.get("query", ""), academic, practical))
+            else:
+                results.append({
+                    "query": pair.get("query", ""),
+                    "error": "Batch judgment missing or unparseable"
+                })
+        return results
+
     def get_perspectives(self) -> Dict[str, Dict[str, str]]:
         """Get information about available judging perspectives."""
         return self.perspectives
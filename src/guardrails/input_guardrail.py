@@ -13,6 +13,12 @@ from typing import Dict, Any, List
 import re
 import logging
 
+from src.guardrails.patterns import (
+    compile_pattern,
+    literal_alternation,
+    word_alternation,
+)
+
 
 class InputGuardrail:
     """
@@ -72,10 +78,26 @@ class InputGuardrail:
             r"<</SYS>>",
         ]
 
-        # Compile patterns for efficiency
-        self.compiled_injection_patterns = [
-            re.compile(pattern, re.IGNORECASE) for pattern in self.injection_patterns
-        ]
+        # Compile patterns for efficiency: one combined alternation with a
+        # named group per pattern, so the no-injection common case is a
+        # single regex call and lastgroup identifies which pattern fired.
+        # Built through the shared registry, so repeated instantiation
+        # reuses the compiled object.
+        self._injection_combined = compile_pattern(
+            "|".join(f"(?P<p{i}>{pattern})" for i, pattern in enumerate(self.injection_patterns)),
+            re.IGNORECASE
+        )
+
+        # Cheap prefilter: every injection pattern starts with one of these
+        # literal fragments, and benign queries contain none of them, so the
+        # common case skips the big alternation entirely
+        self._injection_triggers = (
+            "ignore", "disregard", "forget", "override", "bypass",
+            "you are now", "pretend", "act as", "roleplay", "from now on",
+            "show", "reveal", "display", "print", "output", "what",
+            "jailbreak", "dan mode", "developer mode", "sudo", "admin mode",
+            "<|", "[inst", "[/inst", "<<sys", "<</sys",
+        )
 
         # Toxic/harmful keywords (expanded list)
         self.harmful_keywords = [
@@ -94,6 +116,22 @@ class InputGuardrail:
             "suicide method", "how to hurt myself",
         ]
 
+        # Single fused trie-regex scan for all harmful keywords: one
+        # prefix-sharing alternation pass over the text instead of one regex
+        # per keyword, with multi-word phrases winning over any single-word
+        # prefix they share.
+        self._harmful_keywords_re = word_alternation(tuple(self.harmful_keywords))
+
+        # Per-keyword patterns for the confirm pass on a trie hit: the fused
+        # scan reports only the longest match at each position, but the
+        # severity/exemption policy counts every keyword present - including
+        # ones embedded in a longer phrase ("hurt" inside "how to hurt
+        # myself" must count as two keywords, not one)
+        self._harmful_keyword_patterns = [
+            (keyword, compile_pattern(rf"\b{re.escape(keyword)}\b"))
+            for keyword in self.harmful_keywords
+        ]
+
         # Research-relevant keywords to determine if query is on-topic
         self.research_keywords = [
             # HCI-related
@@ -119,6 +157,18 @@ class InputGuardrail:
             "trend", "future", "best practice", "guideline",
         ]
 
+        # Same fused trie scans for the on-topic vocabulary: relevance only
+        # needs to know whether any research keyword appears. Single words
+        # are word-bounded ("ai" must not match inside "Champaign"); multi-
+        # word phrases keep their substring semantics ("best practice" must
+        # still match "best practices"), so they go in an unanchored trie.
+        self._research_words_re = word_alternation(
+            tuple(k for k in self.research_keywords if " " not in k)
+        )
+        self._research_phrases_re = literal_alternation(
+            tuple(k for k in self.research_keywords if " " in k)
+        )
+
     def validate(self, query: str) -> Dict[str, Any]:
         """
         Validate input query by running all safety checks.
@@ -138,13 +188,29 @@ class InputGuardrail:
         length_violations = self._check_length(query)
         violations.extend(length_violations)
 
+        # A query past the length cap is rejected regardless of what the
+        # content checks would say, so skip their O(len) scans entirely —
+        # a pathological 50 KB input costs only the len() comparison
+        if len(query) > self.max_query_length:
+            self.logger.warning(
+                "Input validation rejected oversized query (%d chars)", len(query)
+            )
+            return {
+                "valid": False,
+                "violations": violations,
+                "sanitized_input": query[:self.max_query_length]
+            }
+
+        # Case-fold once; every keyword check below reads the same copy
+        query_lower = query.lower()
+
         injection_violations = self._check_prompt_injection(query)
         violations.extend(injection_violations)
 
-        toxic_violations = self._check_toxic_language(query)
+        toxic_violations = self._check_toxic_language(query, query_lower)
         violations.extend(toxic_violations)
 
-        relevance_violations = self._check_relevance(query)
+        relevance_violations = self._check_relevance(query, query_lower)
         violations.extend(relevance_violations)
 
         # Log violations if any
@@ -202,23 +268,31 @@ class InputGuardrail:
         """
         violations = []
 
-        for i, pattern in enumerate(self.compiled_injection_patterns):
-            matches = pattern.findall(text)
-            if matches:
-                # Get the original pattern for logging
-                original_pattern = self.injection_patterns[i]
-                violations.append({
-                    "validator": "prompt_injection",
-                    "reason": f"Potential prompt injection detected",
-                    "severity": "high",
-                    "pattern_matched": original_pattern[:50] + "..." if len(original_pattern) > 50 else original_pattern
-                })
-                # Only report one injection violation to avoid spam
-                break
+        # Quick reject: no trigger fragment means no pattern can match.
+        # The patterns allow any whitespace run but the trigger literals are
+        # single-spaced, so probe a whitespace-collapsed copy - the prefilter
+        # must only ever over-approximate
+        text_lower = text.lower()
+        collapsed = " ".join(text_lower.split())
+        if not any(trigger in collapsed for trigger in self._injection_triggers):
+            return violations
+
+        # One scan over all patterns; only one violation is reported anyway,
+        # so the first match is all we need
+        match = self._injection_combined.search(text)
+        if match:
+            # Get the original pattern for logging
+            original_pattern = self.injection_patterns[int(match.lastgroup[1:])]
+            violations.append({
+                "validator": "prompt_injection",
+                "reason": f"Potential prompt injection detected",
+                "severity": "high",
+                "pattern_matched": original_pattern[:50] + "..." if len(original_pattern) > 50 else original_pattern
+            })
 
         return violations
 
-    def _check_toxic_language(self, text: str) -> List[Dict[str, Any]]:
+    def _check_toxic_language(self, text: str, text_lower: str = None) -> List[Dict[str, Any]]:
         """
         Check for toxic/harmful language.
 
@@ -228,20 +302,27 @@ class InputGuardrail:
 
         Args:
             text: The query text to check
+            text_lower: Optional pre-lowercased copy of text
 
         Returns:
             List of violations found
         """
         violations = []
-        text_lower = text.lower()
-
-        found_keywords = []
-        for keyword in self.harmful_keywords:
-            # Check for whole word matches to reduce false positives
-            # e.g., "attack" in "heart attack research" might be okay
-            pattern = r'\b' + re.escape(keyword) + r'\b'
-            if re.search(pattern, text_lower):
-                found_keywords.append(keyword)
+        if text_lower is None:
+            text_lower = text.lower()
+
+        # Whole-word matches reduce false positives - e.g. "attack" in
+        # "heart attack research" might be okay. The fused trie scan is the
+        # fast path for clean text; on a hit, confirm keyword by keyword so
+        # embedded keywords still count (non-overlapping findall would fold
+        # them into the longest match and understate the count)
+        if self._harmful_keywords_re.search(text_lower) is None:
+            return violations
+
+        found_keywords = [
+            keyword for keyword, pattern in self._harmful_keyword_patterns
+            if pattern.search(text_lower)
+        ]
 
         if found_keywords:
             # Check if it's in a research context
@@ -262,7 +343,7 @@ class InputGuardrail:
 
         return violations
 
-    def _check_relevance(self, query: str) -> List[Dict[str, Any]]:
+    def _check_relevance(self, query: str, query_lower: str = None) -> List[Dict[str, Any]]:
         """
         Check if query is relevant to the system's purpose.
 
@@ -271,30 +352,21 @@ class InputGuardrail:
 
         Args:
             query: The query text to check
+            query_lower: Optional pre-lowercased copy of query
 
         Returns:
             List of violations found
         """
         violations = []
-        query_lower = query.lower()
-
-        # Count how many research-relevant keywords are present
-        # Use word boundary matching to avoid false positives (e.g., "ai" in "Champaign")
-        relevance_score = 0
-        for keyword in self.research_keywords:
-            # Use word boundary regex for single words, substring for phrases
-            if ' ' in keyword:
-                # Multi-word phrase: use substring match
-                if keyword in query_lower:
-                    relevance_score += 1
-            else:
-                # Single word: use word boundary match
-                pattern = r'\b' + re.escape(keyword) + r'\b'
-                if re.search(pattern, query_lower):
-                    relevance_score += 1
+        if query_lower is None:
+            query_lower = query.lower()
 
+        # Two fused trie scans cover the whole vocabulary: word-bounded
+        # single words, substring-matched phrases. Only presence matters
+        # here, so the first hit is enough.
         # If no research keywords found at all, it might be off-topic
-        if relevance_score == 0:
+        if (self._research_words_re.search(query_lower) is None
+                and self._research_phrases_re.search(query_lower) is None):
             # Flag as off-topic - the query doesn't contain any research-relevant terms
             violations.append({
                 "validator": "relevance",
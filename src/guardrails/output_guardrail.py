@@ -13,6 +13,21 @@ from typing import Dict, Any, List, Optional
 import re
 import logging
 
+from src.guardrails.patterns import (
+    compile_pattern,
+    compile_patterns,
+    literal_alternation,
+    named_alternation,
+)
+
+# Long responses are scanned for PII window by window: windows without an
+# @ or a digit are skipped with cheap memchr probes before any regex runs.
+# The margin overlaps adjacent windows so matches spanning a boundary are
+# still seen (PII matches are far shorter than the margin).
+_PII_SCAN_THRESHOLD = 4096
+_PII_WINDOW = 2048
+_PII_MARGIN = 64
+
 
 class OutputGuardrail:
     """
@@ -42,11 +57,33 @@ class OutputGuardrail:
             "ip_address": r'\b(?:\d{1,3}\.){3}\d{1,3}\b',
         }
 
-        # Compile patterns for efficiency
-        self.compiled_pii_patterns = {
-            name: re.compile(pattern)
-            for name, pattern in self.pii_patterns.items()
-        }
+        # Compile patterns for efficiency, through the shared registry so
+        # repeated instantiation reuses the compiled objects
+        self.compiled_pii_patterns = dict(zip(
+            self.pii_patterns,
+            compile_patterns(tuple(self.pii_patterns.values()))
+        ))
+
+        # All PII patterns fused into one alternation with a named group per
+        # type: _check_pii walks the text once and buckets matches by
+        # m.lastgroup instead of running six separate scans
+        self._pii_combined = named_alternation(tuple(self.pii_patterns.items()))
+
+        # Structure-of-arrays view of the PII types: parallel tuples indexed
+        # together, so the match loop walks flat arrays instead of dict
+        # views, with the false-positive filters pre-split per type
+        self._pii_names = tuple(self.pii_patterns)
+        self._pii_index = {name: index for index, name in enumerate(self._pii_names)}
+        self._pii_exact_fps = tuple(
+            frozenset({"123-456-7890", "000-000-0000", "111-111-1111"}) if name == "phone_us"
+            else frozenset({"127.0.0.1", "0.0.0.0", "192.168.1.1", "10.0.0.1"}) if name == "ip_address"
+            else frozenset()
+            for name in self._pii_names
+        )
+        self._pii_substring_fps = tuple(
+            ("example.com", "test.com", "domain.com", "@...") if name == "email" else ()
+            for name in self._pii_names
+        )
 
         # Harmful content keywords in outputs
         self.harmful_output_keywords = [
@@ -65,6 +102,10 @@ class OutputGuardrail:
             "you should hurt", "harm yourself",
         ]
 
+        # One fused scan over all harmful-output phrases (longest first so
+        # overlapping phrases resolve to the longer match)
+        self._harmful_output_re = literal_alternation(tuple(self.harmful_output_keywords))
+
         # Bias indicators
         self.bias_indicators = [
             # Absolute statements without evidence
@@ -75,17 +116,33 @@ class OutputGuardrail:
             r'\b(obviously|clearly|everyone knows)\b',
         ]
 
-        self.compiled_bias_patterns = [
-            re.compile(pattern, re.IGNORECASE) for pattern in self.bias_indicators
-        ]
+        self.compiled_bias_patterns = list(
+            compile_patterns(tuple(self.bias_indicators), re.IGNORECASE)
+        )
+
+        # Citation indicators: all but one are plain literals, checked with
+        # substring containment on the lowercased response; only the
+        # year-in-parentheses form still needs a regex
+        self._citation_literals = (
+            "[source:", "[citation:", "according to", "as stated in",
+            "et al.", "references:", "reference:",
+        )
+        self._citation_year_re = compile_pattern(r'\(\d{4}\)')
 
-    def validate(self, response: str, sources: Optional[List[Dict[str, Any]]] = None) -> Dict[str, Any]:
+    def validate(
+        self,
+        response: str,
+        sources: Optional[List[Dict[str, Any]]] = None,
+        precomputed: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
         """
         Validate output response by running all safety checks.
 
         Args:
             response: Generated response to validate
             sources: Optional list of sources used (for fact-checking)
+            precomputed: Optional citation-scan counts from the caller's own
+                extraction pass (see src.tools.citation_tool.scan_citations)
 
         Returns:
             Validation result with:
@@ -95,18 +152,21 @@ class OutputGuardrail:
         """
         violations = []
 
+        # Case-fold once for the keyword-based checks
+        response_lower = response.lower()
+
         # Run all checks
         pii_violations = self._check_pii(response)
         violations.extend(pii_violations)
 
-        harmful_violations = self._check_harmful_content(response)
+        harmful_violations = self._check_harmful_content(response, response_lower)
         violations.extend(harmful_violations)
 
         bias_violations = self._check_bias(response)
         violations.extend(bias_violations)
 
         if sources:
-            citation_violations = self._check_citations(response, sources)
+            citation_violations = self._check_citations(response, sources, precomputed)
             violations.extend(citation_violations)
 
         # Log violations if any
@@ -139,11 +199,36 @@ class OutputGuardrail:
         """
         violations = []
 
-        for pii_type, pattern in self.compiled_pii_patterns.items():
-            matches = pattern.findall(text)
+        # Quick reject: every PII pattern needs an @ or a digit, and most
+        # prose responses contain neither
+        if "@" not in text and not any(digit in text for digit in "0123456789"):
+            return violations
+
+        buckets: Dict[str, List[str]] = {}
+        if len(text) > _PII_SCAN_THRESHOLD:
+            # Regex only the candidate windows of a long document; prose
+            # windows fail the sentinel probe and are skipped outright
+            seen = set()
+            for start in range(0, len(text), _PII_WINDOW):
+                window_start = max(0, start - _PII_MARGIN)
+                window = text[window_start:start + _PII_WINDOW + _PII_MARGIN]
+                if "@" not in window and not any(digit in window for digit in "0123456789"):
+                    continue
+                for match in self._pii_combined.finditer(window):
+                    key = (window_start + match.start(), match.lastgroup)
+                    if key not in seen:
+                        seen.add(key)
+                        buckets.setdefault(match.lastgroup, []).append(match.group())
+        else:
+            # One pass over the text for all PII types
+            for match in self._pii_combined.finditer(text):
+                buckets.setdefault(match.lastgroup, []).append(match.group())
+
+        for index, pii_type in enumerate(self._pii_names):
+            matches = buckets.get(pii_type)
             if matches:
                 # Filter out common false positives
-                filtered_matches = self._filter_pii_false_positives(pii_type, matches)
+                filtered_matches = self._filter_pii_false_positives(index, matches)
 
                 if filtered_matches:
                     violations.append({
@@ -157,40 +242,31 @@ class OutputGuardrail:
 
         return violations
 
-    def _filter_pii_false_positives(self, pii_type: str, matches: List[str]) -> List[str]:
+    def _filter_pii_false_positives(self, index: int, matches: List[str]) -> List[str]:
         """
         Filter out common false positives in PII detection.
 
+        Example/placeholder emails, placeholder phone numbers, and
+        localhost/documentation IPs are dropped via the per-type filter
+        tuples built in __init__.
+
         Args:
-            pii_type: Type of PII being checked
+            index: Index of the PII type in self._pii_names
             matches: List of matches found
 
         Returns:
             Filtered list of actual PII matches
         """
-        filtered = []
+        exact_fps = self._pii_exact_fps[index]
+        substring_fps = self._pii_substring_fps[index]
 
-        for match in matches:
-            # Skip example/placeholder values
-            if pii_type == "email":
-                if any(x in match.lower() for x in ["example.com", "test.com", "domain.com", "@..."]):
-                    continue
-
-            if pii_type == "phone_us":
-                # Skip common placeholder patterns
-                if match in ["123-456-7890", "000-000-0000", "111-111-1111"]:
-                    continue
-
-            if pii_type == "ip_address":
-                # Skip localhost and common documentation IPs
-                if match in ["127.0.0.1", "0.0.0.0", "192.168.1.1", "10.0.0.1"]:
-                    continue
-
-            filtered.append(match)
-
-        return filtered
+        return [
+            match for match in matches
+            if match not in exact_fps
+            and not any(fp in match.lower() for fp in substring_fps)
+        ]
 
-    def _check_harmful_content(self, text: str) -> List[Dict[str, Any]]:
+    def _check_harmful_content(self, text: str, text_lower: str = None) -> List[Dict[str, Any]]:
         """
         Check for harmful or inappropriate content.
 
@@ -199,17 +275,17 @@ class OutputGuardrail:
 
         Args:
             text: The response text to check
+            text_lower: Optional pre-lowercased copy of text
 
         Returns:
             List of violations found
         """
         violations = []
-        text_lower = text.lower()
+        if text_lower is None:
+            text_lower = text.lower()
 
-        found_harmful = []
-        for keyword in self.harmful_output_keywords:
-            if keyword in text_lower:
-                found_harmful.append(keyword)
+        # Single alternation pass instead of one substring scan per phrase
+        found_harmful = list(dict.fromkeys(self._harmful_output_re.findall(text_lower)))
 
         if found_harmful:
             violations.append({
@@ -252,7 +328,12 @@ class OutputGuardrail:
 
         return violations
 
-    def _check_citations(self, response: str, sources: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def _check_citations(
+        self,
+        response: str,
+        sources: List[Dict[str, Any]],
+        precomputed: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
         """
         Check if response properly cites sources.
 
@@ -262,27 +343,29 @@ class OutputGuardrail:
         Args:
             response: The response text to check
             sources: List of sources used
+            precomputed: Optional citation-scan counts already computed by
+                the caller; a positive count proves citations exist without
+                re-scanning the response
 
         Returns:
             List of violations found
         """
         violations = []
 
-        # Check if response has any citation indicators
-        citation_patterns = [
-            r'\[Source:',
-            r'\[Citation:',
-            r'\(\d{4}\)',  # Year in parentheses
-            r'according to',
-            r'as stated in',
-            r'et al\.',
-            r'References?:',
-        ]
-
+        # A precomputed scan showing any citation indicator lets us skip the
+        # pattern sweep entirely; a zero count still falls through to the
+        # phrase-based patterns below, which cover forms the scan does not
+        if precomputed and any(
+            precomputed.get(key, 0) for key in ("intext", "references", "doi", "url")
+        ):
+            return violations
+
+        # Check if response has any citation indicators: the literal forms
+        # are plain substring checks, with one regex left for "(2024)"
+        response_lower = response.lower()
         has_citations = any(
-            re.search(pattern, response, re.IGNORECASE)
-            for pattern in citation_patterns
-        )
+            literal in response_lower for literal in self._citation_literals
+        ) or bool(self._citation_year_re.search(response))
 
         # If sources were provided but response has no citations
         if sources and len(sources) > 0 and not has_citations:
@@ -325,22 +408,28 @@ class OutputGuardrail:
 
         Args:
             text: The response text to sanitize
-            violations: List of violations (used to find PII matches)
+            violations: List of violations (used to decide if PII was found)
 
         Returns:
             Sanitized text
         """
-        sanitized = text
-
-        # Redact PII matches
-        for violation in violations:
-            if violation.get("validator") == "pii":
-                matches = violation.get("matches", [])
-                for match in matches:
-                    pii_type = violation.get("pii_type", "PII")
-                    sanitized = sanitized.replace(match, f"[REDACTED {pii_type.upper()}]")
-
-        return sanitized
+        # Nothing to redact in the common case
+        if not any(v.get("validator") == "pii" for v in violations):
+            return text
+
+        # One linear sub over the combined pattern instead of an O(len)
+        # str.replace per match; known false positives pass through
+        # untouched, everything else is redacted by type
+        def redact(match: "re.Match") -> str:
+            index = self._pii_index[match.lastgroup]
+            token = match.group()
+            if token in self._pii_exact_fps[index] or any(
+                fp in token.lower() for fp in self._pii_substring_fps[index]
+            ):
+                return token
+            return f"[REDACTED {match.lastgroup.upper()}]"
+
+        return self._pii_combined.sub(redact, text)
 
     def get_validation_summary(self) -> Dict[str, Any]:
         """
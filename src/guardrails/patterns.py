@@ -0,0 +1,79 @@
+"""
+Shared Pattern Registry
+Caches compiled guardrail patterns across instances.
+
+Guardrails are re-instantiated per SafetyManager (and per test), and each
+instance used to rebuild identical alternation sources and re.Pattern
+objects. The lru_cache'd builders below key on the immutable pattern inputs,
+so every instance after the first gets the already-compiled objects back.
+"""
+
+import re
+from functools import lru_cache
+from typing import Tuple
+
+
+@lru_cache(maxsize=None)
+def compile_pattern(source: str, flags: int = 0) -> "re.Pattern":
+    """Compile one pattern, shared across instances."""
+    return re.compile(source, flags)
+
+
+@lru_cache(maxsize=None)
+def compile_patterns(sources: Tuple[str, ...], flags: int = 0) -> Tuple["re.Pattern", ...]:
+    """Compile a tuple of patterns, shared across instances."""
+    return tuple(re.compile(source, flags) for source in sources)
+
+
+def _trie_source(keywords: Tuple[str, ...]) -> str:
+    """
+    Factor literal keywords into a prefix-sharing trie regex.
+
+    A flat alternation retries every keyword at each position; the factored
+    form ("att(?:ack|empt)") walks shared prefixes once and fails fast.
+    Word endings become greedy optional tails, so the engine still prefers
+    the longest phrase over any keyword that is a prefix of it.
+    """
+    root: dict = {}
+    for keyword in keywords:
+        node = root
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[""] = {}
+    return _serialize_trie(root)
+
+
+def _serialize_trie(node: dict) -> str:
+    ends_here = "" in node
+    branches = [
+        re.escape(char) + _serialize_trie(node[char])
+        for char in sorted(node)
+        if char
+    ]
+    if not branches:
+        return ""
+    if len(branches) == 1 and not ends_here:
+        return branches[0]
+    body = "(?:" + "|".join(branches) + ")"
+    return body + "?" if ends_here else body
+
+
+@lru_cache(maxsize=None)
+def word_alternation(keywords: Tuple[str, ...]) -> "re.Pattern":
+    """Fuse literal keywords into one word-bounded trie alternation."""
+    return re.compile(r"\b" + _trie_source(keywords) + r"\b")
+
+
+@lru_cache(maxsize=None)
+def literal_alternation(keywords: Tuple[str, ...]) -> "re.Pattern":
+    """Fuse literal keywords into one unanchored trie alternation."""
+    return re.compile(_trie_source(keywords))
+
+
+@lru_cache(maxsize=None)
+def named_alternation(named_sources: Tuple[Tuple[str, str], ...], flags: int = 0) -> "re.Pattern":
+    """Fuse (name, pattern) pairs into one alternation with named groups."""
+    return re.compile(
+        "|".join(f"(?P<{name}>{pattern})" for name, pattern in named_sources),
+        flags
+    )
@@ -7,6 +7,7 @@ input and output safety checks in the multi-agent system.
 """
 
 from typing import Dict, Any, List, Optional
+from collections import deque
 import logging
 from datetime import datetime
 import json
@@ -36,8 +37,9 @@ class SafetyManager:
         self.log_events = config.get("log_events", True)
         self.logger = logging.getLogger("safety")
 
-        # Safety event log
-        self.safety_events: List[Dict[str, Any]] = []
+        # Safety event log, bounded so long-running servers keep constant
+        # memory; the newest max_events entries are retained
+        self.safety_events: deque = deque(maxlen=config.get("max_events", 500))
 
         # Prohibited categories
         self.prohibited_categories = config.get("prohibited_categories", [
@@ -105,13 +107,20 @@ class SafetyManager:
 
         return response
 
-    def check_output_safety(self, response: str, sources: Optional[List[Dict[str, Any]]] = None) -> Dict[str, Any]:
+    def check_output_safety(
+        self,
+        response: str,
+        sources: Optional[List[Dict[str, Any]]] = None,
+        precomputed: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
         """
         Check if output response is safe to return.
 
         Args:
             response: Generated response to check
             sources: Optional list of sources used
+            precomputed: Optional citation-scan counts already computed by the
+                caller, letting the guardrail skip its own re-scan
 
         Returns:
             Dictionary with:
@@ -123,7 +132,7 @@ class SafetyManager:
             return {"safe": True, "violations": [], "response": response}
 
         # Use OutputGuardrail to validate
-        result = self.output_guardrail.validate(response, sources)
+        result = self.output_guardrail.validate(response, sources, precomputed)
 
         is_safe = result["valid"]
         violations = result["violations"]
@@ -259,8 +268,8 @@ class SafetyManager:
             self.logger.error(f"Failed to write safety log: {e}")
 
     def get_safety_events(self) -> List[Dict[str, Any]]:
-        """Get all logged safety events."""
-        return self.safety_events
+        """Get all retained safety events (newest max_events entries)."""
+        return list(self.safety_events)
 
     def get_safety_stats(self) -> Dict[str, Any]:
         """
@@ -292,7 +301,7 @@ class SafetyManager:
 
     def clear_events(self):
         """Clear safety event log."""
-        self.safety_events = []
+        self.safety_events.clear()
         self.logger.info("Safety events cleared")
 
     def is_enabled(self) -> bool:
@@ -13,6 +13,12 @@ import logging
 import asyncio
 from itertools import islice
 
+from src.tools.search_cache import SearchCache
+
+# Shared cache so repeated/overlapping searches across evaluation queries
+# skip the external API round-trip
+_paper_search_cache = SearchCache(ttl=86400)
+
 
 class PaperSearchTool:
     """
@@ -281,6 +287,10 @@ def paper_search(query: str, max_results: int = 10, year_from: Optional[int] = N
     Returns:
         Formatted string with paper results
     """
+    cached = _paper_search_cache.get(query, max_results, year_from)
+    if cached is not None:
+        return cached
+
     tool = PaperSearchTool(max_results=max_results)
     results = asyncio.run(tool.search(query, year_from=year_from))
 
@@ -309,4 +319,5 @@ def paper_search(query: str, max_results: int = 10, year_from: Optional[int] = N
         output += f"   URL: {paper['url']}\n"
         output += "\n"
 
+    _paper_search_cache.put(query, max_results, year_from, result=output)
     return output
@@ -0,0 +1,79 @@
+"""
+Search Result Cache
+Caches search tool results so repeated queries skip external API calls.
+
+The Researcher agent issues overlapping searches across evaluation queries
+(e.g. "user-centered design", "usability"), so caching by normalized query
+string eliminates a large share of redundant web/paper API traffic.
+"""
+
+from typing import Any, Dict, Optional, Tuple
+import logging
+import time
+
+
+class SearchCache:
+    """
+    Small in-memory TTL cache for search tool results.
+
+    Queries are normalized (lowercased, whitespace-collapsed) before lookup so
+    trivially restated queries still hit. Entries expire after `ttl` seconds
+    to avoid serving stale search results.
+    """
+
+    def __init__(self, ttl: float = 86400.0):
+        """
+        Initialize the cache.
+
+        Args:
+            ttl: Time-to-live for cached entries, in seconds (default: 1 day)
+        """
+        self.ttl = ttl
+        self.logger = logging.getLogger("tools.search_cache")
+        self._entries: Dict[Tuple, Tuple[float, Any]] = {}
+
+    @staticmethod
+    def normalize(query: str) -> str:
+        """Normalize a query string for cache lookup."""
+        return " ".join(query.lower().split())
+
+    def get(self, query: str, *params) -> Optional[Any]:
+        """
+        Look up a cached result.
+
+        Args:
+            query: The search query
+            *params: Additional parameters that affect the result
+                (e.g. max_results, year_from)
+
+        Returns:
+            The cached result, or None on miss/expiry
+        """
+        key = (self.normalize(query),) + params
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        stored_at, result = entry
+        if time.monotonic() - stored_at > self.ttl:
+            del self._entries[key]
+            return None
+
+        self.logger.debug(f"Cache hit for query: {query}")
+        return result
+
+    def put(self, query: str, *params, result: Any):
+        """
+        Store a result in the cache.
+
+        Args:
+            query: The search query
+            *params: Additional parameters that affect the result
+            result: The result to cache
+        """
+        key = (self.normalize(query),) + params
+        self._entries[key] = (time.monotonic(), result)
+
+    def clear(self):
+        """Drop all cached entries."""
+        self._entries = {}
@@ -11,6 +11,12 @@ import os
 import logging
 import asyncio
 
+from src.tools.search_cache import SearchCache
+
+# Shared cache so repeated/overlapping searches across evaluation queries
+# skip the external API round-trip
+_web_search_cache = SearchCache(ttl=86400)
+
 
 class WebSearchTool:
     """
@@ -235,6 +241,10 @@ def web_search(query: str, max_results: int = 5) -> str:
     elif os.getenv("BRAVE_API_KEY"):
         provider = "brave"
 
+    cached = _web_search_cache.get(query, provider, max_results)
+    if cached is not None:
+        return cached
+
     try:
         tool = WebSearchTool(provider=provider, max_results=max_results)
         results = asyncio.run(tool.search(query))
@@ -253,6 +263,7 @@ def web_search(query: str, max_results: int = 5) -> str:
                 output += f"   Published: {result['published_date']}\n"
             output += "\n"
 
+        _web_search_cache.put(query, provider, max_results, result=output)
         return output
     except Exception as e:
         return f"Search error occurred: {str(e)}. Please try again with different search terms."
@@ -95,6 +95,12 @@ def test_input_guardrail():
         ("Research context with keyword",
          "Research on cyber attack patterns in academic literature",
          True),  # Should pass because it's in research context
+
+        ("Embedded keyword in research context",
+         "Research on why people search how to hurt myself",
+         False),  # "hurt" inside "how to hurt myself" counts as a second
+                  # keyword, so the single-keyword research exemption must
+                  # not apply
     ]
 
     passed = 0